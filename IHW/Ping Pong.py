@@ -1,165 +1,172 @@
-import tkinter as tk
+import argparse
+import asyncio
 import random
+import threading
+import tkinter as tk
+
+from pong_engine import PongEngine, WIDTH, HEIGHT, P1_UP, P1_DOWN, P2_UP, P2_DOWN, encode_input
+from pong_loop import GameLoop
+from pong_replay import Replay, ReplayRecorder, ReplayPlayer
+from pong_net import PongClient
+from pong_ai import PredictiveAI
+from pong_render import TkRenderer
+
+# Параметри запуску: запис матчу у файл або перегляд записаного
+parser = argparse.ArgumentParser(description="Ping-pong")
+parser.add_argument("--record", metavar="FILE", help="записати матч у файл повтору")
+parser.add_argument("--replay", metavar="FILE", help="переглянути записаний матч")
+parser.add_argument("--seed", type=int, help="сід подач м'яча")
+parser.add_argument("--connect", metavar="HOST:PORT", help="грати через мережевий сервер")
+parser.add_argument("--ai", type=int, choices=(1, 2), action="append", default=[],
+                    help="ракеткою гравця керує комп'ютер (можна вказати двічі)")
+parser.add_argument("--ai-reaction", type=int, default=4, help="затримка реакції комп'ютера, кроки")
+parser.add_argument("--ai-error", type=float, default=25.0, help="похибка прицілу комп'ютера, px")
+args = parser.parse_args()
 
 # Створення головного вікна
 window = tk.Tk()
 window.title("Ping-pong")
 
-# Розміри вікна
-WIDTH = 800
-HEIGHT = 400
+# Ігровий рушій: стан і правила живуть окремо від tkinter.
+# Під час перегляду рушієм керує програвач, під час запису - записувач.
+player = recorder = net_client = None
+if args.connect:
+    # Мережева гра: правила рахує сервер, клієнт лише шле клавіші й малює
+    host, port = args.connect.rsplit(":", 1)
+    net_client = PongClient()
+    net_loop = asyncio.new_event_loop()
+    net_loop.run_until_complete(net_client.connect(host, int(port)))
+    threading.Thread(target=net_loop.run_until_complete,
+                     args=(net_client.receive(),), daemon=True).start()
+    engine = net_client.state
+elif args.replay:
+    player = ReplayPlayer(Replay.load(args.replay))
+    engine = player.engine
+elif args.record:
+    engine = PongEngine(seed=args.seed if args.seed is not None else random.randrange(2 ** 32))
+    recorder = ReplayRecorder(engine)
+else:
+    engine = PongEngine(seed=args.seed)
 
 # Створення Canvas
 canvas = tk.Canvas(window, width=WIDTH, height=HEIGHT, bg="black")
 canvas.pack()
 
-# Розміри ракеток і м'яча
-PADDLE_WIDTH = 10
-PADDLE_HEIGHT = 100
-BALL_SIZE = 20
-
-# Початкові координати ракеток
-paddle1_x = 20
-paddle1_y = HEIGHT // 2 - PADDLE_HEIGHT // 2
-
-paddle2_x = WIDTH - 20 - PADDLE_WIDTH
-paddle2_y = HEIGHT // 2 - PADDLE_HEIGHT // 2
-
-# Швидкість
-paddle_speed = 20
-ball_speed = 10
-ball_dx = ball_speed
-ball_dy = ball_speed
-
-# Рахунок
-score1 = 0
-score2 = 0
-
-# Максимальний рахунок
-MAX_SCORE = 1
+# Малювання: лише змінені елементи Canvas
+renderer = TkRenderer(canvas)
 
 # Стан гри
 game_paused = False
-game_over = False
 
-# Ракетки
-paddle1 = canvas.create_rectangle(paddle1_x, paddle1_y,
-                                  paddle1_x + PADDLE_WIDTH, paddle1_y + PADDLE_HEIGHT, fill="white")
-paddle2 = canvas.create_rectangle(paddle2_x, paddle2_y,
-                                  paddle2_x + PADDLE_WIDTH, paddle2_y + PADDLE_HEIGHT, fill="white")
-
-# М'яч
-ball = canvas.create_oval(WIDTH // 2 - BALL_SIZE // 2, HEIGHT // 2 - BALL_SIZE // 2,
-                          WIDTH // 2 + BALL_SIZE // 2, HEIGHT // 2 + BALL_SIZE // 2, fill="white")
-
-# Рахунок
-score_text = canvas.create_text(WIDTH // 2, 20, text="0 : 0",
-                                font=("Arial", 24), fill="white")
+# Накладка з метриками ігрового циклу (вмикається клавішею F3)
+show_metrics = False
 
 # Функція перемикання паузи
 def toggle_pause():
     global game_paused
-    if game_over:
-        return  # Не можна ставити на паузу, якщо гра завершена
+    if engine.game_over or net_client:
+        return  # Не можна ставити на паузу, якщо гра завершена або йде на сервері
     game_paused = not game_paused
     if game_paused:
         pause_button.config(text="Continue")
+        loop.stop()
     else:
         pause_button.config(text="Pause")
-        move_ball()
+        loop.start()  # Повторний запуск не створить другого циклу
+
+def toggle_metrics(event):
+    global show_metrics
+    show_metrics = not show_metrics
 
 # Кнопка паузи
 pause_button = tk.Button(window, text="Pause", command=toggle_pause)
 pause_button.pack()
 
-# Обмеження руху ракеток
-def move_paddle(paddle, dy):
-    if game_over:
-        return
-    paddle_pos = canvas.coords(paddle)
-    if paddle_pos[1] + dy >= 0 and paddle_pos[3] + dy <= HEIGHT:
-        canvas.move(paddle, 0, dy)
+# Клавіші керування та відповідні біти стану
+KEY_BITS = {"w": P1_UP, "s": P1_DOWN, "up": P2_UP, "down": P2_DOWN}
 
-# Функції руху ракеток
-def move_paddle1_up(event):
-    move_paddle(paddle1, -paddle_speed)
+# Натиснуті зараз клавіші; рушій читає їх один раз за крок.
+# tapped_keys запам'ятовує короткі натискання, відпущені ще до кроку.
+pressed_keys = 0
+tapped_keys = 0
 
-def move_paddle1_down(event):
-    move_paddle(paddle1, paddle_speed)
+def key_press(event):
+    global pressed_keys, tapped_keys
+    bit = KEY_BITS.get(event.keysym.lower(), 0)
+    pressed_keys |= bit
+    tapped_keys |= bit
 
-def move_paddle2_up(event):
-    move_paddle(paddle2, -paddle_speed)
+def key_release(event):
+    global pressed_keys
+    pressed_keys &= ~KEY_BITS.get(event.keysym.lower(), 0)
 
-def move_paddle2_down(event):
-    move_paddle(paddle2, paddle_speed)
+def release_all(event):
+    global pressed_keys
+    pressed_keys = 0
 
 # Прив'язка клавіш
-window.bind("w", move_paddle1_up)
-window.bind("s", move_paddle1_down)
-window.bind("<Up>", move_paddle2_up)
-window.bind("<Down>", move_paddle2_down)
+window.bind("<KeyPress>", key_press)
+window.bind("<KeyRelease>", key_release)
+window.bind("<FocusOut>", release_all)
+window.bind("<F3>", toggle_metrics)
+
+# Відображення стану рушія на Canvas (у мережевій грі - інтерпольованого)
+def render():
+    state = net_client.interpolated() if net_client else engine
+    renderer.draw(state, loop.metrics.summary() if show_metrics else None)
+
+# Клавіші мережевого гравця: обидві пари керують його власною ракеткою
+def network_buttons(keys):
+    up = keys & (P1_UP | P2_UP)
+    down = keys & (P1_DOWN | P2_DOWN)
+    if net_client.player == 1:
+        return (P1_UP if up else 0) | (P1_DOWN if down else 0)
+    return (P2_UP if up else 0) | (P2_DOWN if down else 0)
+
+# Мережевий "крок": лише надіслати клавіші, стан приходить від сервера
+def network_step():
+    buttons = network_buttons(pressed_keys | tapped_keys)
+    net_loop.call_soon_threadsafe(net_client.send_input, buttons)
+
+# Комп'ютерні гравці натискають "клавіші" замість людини
+ai_players = {side: PredictiveAI(args.ai_reaction, args.ai_error) for side in args.ai}
+
+def local_buttons():
+    buttons = pressed_keys | tapped_keys
+    for side, ai in ai_players.items():
+        direction = ai(engine, side)
+        if side == 1:
+            buttons = buttons & ~(P1_UP | P1_DOWN) | encode_input(direction, 0)
+        else:
+            buttons = buttons & ~(P2_UP | P2_DOWN) | encode_input(0, direction)
+    return buttons
 
 # Рух м'яча та логіка гри
-def move_ball():
-    global ball_dx, ball_dy, score1, score2, game_over
-
-    if game_paused or game_over:
-        return
-
-    # Рух м'яча
-    canvas.move(ball, ball_dx, ball_dy)
-
-    # Координати м'яча та ракеток
-    ball_pos = canvas.coords(ball)
-    paddle1_pos = canvas.coords(paddle1)
-    paddle2_pos = canvas.coords(paddle2)
-
-    # Відбивання від верхньої та нижньої меж
-    if ball_pos[1] <= 0 or ball_pos[3] >= HEIGHT:
-        ball_dy = -ball_dy
-
-    # Відбивання від лівої ракетки
-    if (ball_pos[0] <= paddle1_pos[2] and
-        ball_pos[1] + BALL_SIZE // 2 >= paddle1_pos[1] and
-        ball_pos[1] + BALL_SIZE // 2 <= paddle1_pos[3]):
-        ball_dx = -ball_dx
-
-    # Відбивання від правої ракетки
-    if (ball_pos[2] >= paddle2_pos[0] and
-        ball_pos[1] + BALL_SIZE // 2 >= paddle2_pos[1] and
-        ball_pos[1] + BALL_SIZE // 2 <= paddle2_pos[3]):
-        ball_dx = -ball_dx
-
-    # Забитий гол ліворуч
-    if ball_pos[0] <= 0:
-        score2 += 1
-        canvas.itemconfig(score_text, text=f"{score1} : {score2}")
-        reset_ball()
-
-    # Забитий гол праворуч
-    elif ball_pos[2] >= WIDTH:
-        score1 += 1
-        canvas.itemconfig(score_text, text=f"{score1} : {score2}")
-        reset_ball()
-
-    # Перевірка завершення гри
-    if score1 >= MAX_SCORE or score2 >= MAX_SCORE:
-        game_over = True
-        winner = "Лівий гравець" if score1 >= MAX_SCORE else "Правий гравець"
-        canvas.create_text(WIDTH // 2, HEIGHT // 2, text=f"{winner} переміг!",
-                           font=("Times new roman", 36), fill="white")
-        return
-
-    # Рекурсивний виклик функції
-    window.after(30, move_ball)
-
-def reset_ball():
-    global ball_dx, ball_dy
-    canvas.coords(ball, WIDTH // 2 - BALL_SIZE // 2, HEIGHT // 2 - BALL_SIZE // 2,
-                  WIDTH // 2 + BALL_SIZE // 2, HEIGHT // 2 + BALL_SIZE // 2)
-    ball_dx = ball_speed * random.choice([-1, 1])
-    ball_dy = ball_speed * random.choice([-1, 1])
-    
+def game_step():
+    global tapped_keys
+
+    # Один крок симуляції з поточним станом клавіш
+    if net_client:
+        network_step()
+    elif player:
+        player.step()
+    elif recorder:
+        recorder.step(local_buttons())
+    else:
+        engine.step(local_buttons())
+    tapped_keys = 0
+
+    # Перевірка завершення гри (напис переможця малює renderer)
+    if engine.game_over:
+        if recorder:
+            recorder.finish().save(args.record)
+        return False
+    return not (player and player.finished)
+
+# Ігровий цикл за реальним часом замість window.after(30, ...) після кожного кадру
+loop = GameLoop(window, game_step, render)
+
 # Запуск гри
-move_ball()
+render()
+loop.start()
 window.mainloop()
@@ -0,0 +1,90 @@
+import random
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy потрібен лише для масивів BatchPong
+    np = None
+
+from pong_engine import (HEIGHT, BALL_SIZE, PADDLE_HEIGHT, PADDLE_SPEED,
+                         PADDLE1_FACE, PADDLE2_FACE)
+
+# Діапазон, у якому рухається верхній край м'яча між стінками
+BALL_RANGE = HEIGHT - BALL_SIZE
+
+
+def fold(y):
+    """Згортає "розгорнуту" координату м'яча назад у поле між стінками.
+
+    Політ зі стінками еквівалентний польоту по прямій у дзеркальних
+    копіях поля, тож відбиття - це лише залишок від ділення на 2 * BALL_RANGE.
+    """
+    y = y % (2 * BALL_RANGE)
+    return y - 2 * (y - BALL_RANGE) * (y > BALL_RANGE)
+
+
+def predict_intercept(ball_x, ball_y, ball_dx, ball_dy, player):
+    """Центр м'яча по вертикалі, коли він долетить до площини ракетки player.
+
+    Якщо м'яч летить від гравця, вважається, що суперник його відіб'є:
+    шлях до ракетки суперника й назад додається до горизонтальної відстані.
+    Обчислення замкнене й коштує O(1) незалежно від відстані; працює і з
+    числами, і з масивами NumPy.
+    """
+    own, other = (PADDLE1_FACE, PADDLE2_FACE) if player == 1 else (PADDLE2_FACE, PADDLE1_FACE)
+    toward = (ball_dx < 0) if player == 1 else (ball_dx > 0)
+    direct = abs(own - ball_x)
+    via_other = abs(other - ball_x) + abs(other - own)
+    distance = direct * toward + via_other * (1 - toward)
+    ticks = distance / abs(ball_dx)
+    return fold(ball_y + ball_dy * ticks) + BALL_SIZE // 2
+
+
+class PredictiveAI:
+    """Стратегія ракетки з передбаченням траєкторії.
+
+    Викликається як track_ball: (стан, гравець) -> -1, 0 або 1, тож
+    підходить і для PongEngine.run(), і для BatchPong.run(), і для гри з
+    людиною. reaction_ticks - на скільки кроків запізнюється те, що бачить
+    комп'ютер; error - стандартне відхилення похибки цілі в пікселях, нова
+    похибка береться щоразу, коли м'яч змінює горизонтальний напрямок.
+    """
+
+    def __init__(self, reaction_ticks=0, error=0.0, dead_zone=PADDLE_SPEED // 2, seed=None):
+        self.reaction_ticks = reaction_ticks
+        self.error = error
+        self.dead_zone = dead_zone
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.np_rng = None
+        self.history = deque(maxlen=reaction_ticks + 1)
+        self.noise = 0.0
+        self.last_dx = None
+
+    def _update_noise(self, ball_dx):
+        if not self.error:
+            return
+        if hasattr(ball_dx, "shape"):
+            # Масиви BatchPong: окрема похибка для кожного матчу
+            if self.np_rng is None:
+                self.np_rng = np.random.default_rng(self.seed)
+                self.noise = np.zeros(ball_dx.shape)
+                self.last_dx = np.zeros(ball_dx.shape)
+            changed = np.sign(ball_dx) != np.sign(self.last_dx)
+            fresh = self.np_rng.normal(0.0, self.error, ball_dx.shape)
+            self.noise = np.where(changed, fresh, self.noise)
+        elif self.last_dx is None or (ball_dx > 0) != (self.last_dx > 0):
+            self.noise = self.rng.gauss(0.0, self.error)
+        self.last_dx = ball_dx
+
+    def __call__(self, state, player):
+        # Множення на 1 копіює і число, і масив, тож історія не змінюється разом зі станом
+        self.history.append((state.ball_x * 1, state.ball_y * 1,
+                             state.ball_dx * 1, state.ball_dy * 1))
+        ball_x, ball_y, ball_dx, ball_dy = self.history[0]
+        self._update_noise(ball_dx)
+
+        target = predict_intercept(ball_x, ball_y, ball_dx, ball_dy, player) + self.noise
+        paddle_y = state.paddle1_y if player == 1 else state.paddle2_y
+        diff = target - (paddle_y + PADDLE_HEIGHT // 2)
+        return (diff > self.dead_zone) * 1 - (diff < -self.dead_zone) * 1
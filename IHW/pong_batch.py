@@ -0,0 +1,268 @@
+import random
+import time
+
+import numpy as np
+
+from pong_engine import (PongEngine, WIDTH, HEIGHT, PADDLE_HEIGHT,
+                         BALL_SIZE, PADDLE1_FACE, PADDLE2_FACE, BALL_SPEED,
+                         MAX_SCORE, P1_UP, P1_DOWN, P2_UP, P2_DOWN, NO_HIT, WALL_HIT, PADDLE_HIT, EDGE_HIT, GOAL_LEFT, GOAL_RIGHT,
+                         paddle_travel, policy_buttons, track_ball, idle)
+
+
+def serve_table(seeds, max_score=MAX_SCORE):
+    """Напрямки подач для кожного матчу, ті самі, що дасть PongEngine.reset_ball().
+
+    За матч буде не більше 2 * max_score - 1 голів, а отже й подач,
+    тому їх можна витягнути з random.Random(seed) наперед.
+    """
+    serves = 2 * max_score - 1
+    table = np.empty((len(seeds), serves, 2), dtype=np.int8)
+    rng = random.Random()
+    for i, seed in enumerate(seeds):
+        rng.seed(seed)
+        for k in range(serves):
+            table[i, k, 0] = rng.choice([-1, 1])
+            table[i, k, 1] = rng.choice([-1, 1])
+    return table
+
+
+class BatchPong:
+    """N незалежних матчів, що крокують одночасно як операції над масивами NumPy.
+
+    Атрибути стану називаються так само, як у PongEngine, тому ті самі
+    стратегії ракеток (track_ball, idle) працюють з обома класами.
+    """
+
+    def __init__(self, seeds, max_score=MAX_SCORE, dt=1, swept=False):
+        n = len(seeds)
+        self.n = n
+        self.seeds = np.asarray(seeds)
+        self.max_score = max_score
+        self.dt = dt
+        self.swept = swept
+        self.serves = serve_table(seeds, max_score)
+
+        self.paddle1_y = np.full(n, HEIGHT // 2 - PADDLE_HEIGHT // 2, dtype=np.float64)
+        self.paddle2_y = np.full(n, HEIGHT // 2 - PADDLE_HEIGHT // 2, dtype=np.float64)
+
+        self.ball_x = np.full(n, WIDTH // 2 - BALL_SIZE // 2, dtype=np.float64)
+        self.ball_y = np.full(n, HEIGHT // 2 - BALL_SIZE // 2, dtype=np.float64)
+        self.ball_dx = np.full(n, BALL_SPEED, dtype=np.float64)
+        self.ball_dy = np.full(n, BALL_SPEED, dtype=np.float64)
+
+        self.score1 = np.zeros(n, dtype=np.int32)
+        self.score2 = np.zeros(n, dtype=np.int32)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.tick = np.zeros(n, dtype=np.float64)
+
+    @property
+    def winner(self):
+        """Переможець кожного матчу: 1, 2 або 0, якщо матч ще не завершено."""
+        return np.where(self.game_over, np.where(self.score1 >= self.max_score, 1, 2), 0)
+
+    def move_paddles(self, player, direction):
+        """Зсуває ракетки гравця в усіх матчах за правилом pong_engine.paddle_travel()."""
+        y = self.paddle1_y if player == 1 else self.paddle2_y
+        new_y = paddle_travel(y, np.asarray(direction, dtype=np.float64), self.dt)
+        np.copyto(y, new_y, where=~self.game_over)
+
+    def reset_balls(self, idx):
+        """Подає м'яч заново в матчах idx, беручи напрямки з таблиці подач."""
+        serve = self.serves[idx, self.score1[idx] + self.score2[idx] - 1]
+        self.ball_x[idx] = WIDTH // 2 - BALL_SIZE // 2
+        self.ball_y[idx] = HEIGHT // 2 - BALL_SIZE // 2
+        self.ball_dx[idx] = BALL_SPEED * serve[:, 0]
+        self.ball_dy[idx] = BALL_SPEED * serve[:, 1]
+
+    def apply_input(self, buttons):
+        """Рухає ракетки в усіх матчах за масивом масок клавіш, як PongEngine.apply_input()."""
+        buttons = np.asarray(buttons)
+        up1 = (buttons & P1_UP) != 0
+        up2 = (buttons & P2_UP) != 0
+        self.move_paddles(1, np.where(up1, -1, (buttons & P1_DOWN) != 0))
+        self.move_paddles(2, np.where(up2, -1, (buttons & P2_DOWN) != 0))
+
+    def step(self, buttons=None):
+        """Один крок гри в усіх незавершених матчах одночасно.
+
+        buttons - маска клавіш на цей крок, спільна або окрема для кожного матчу.
+        """
+        active = ~self.game_over
+        self.tick += self.dt * active
+
+        if buttons is not None:
+            self.apply_input(buttons)
+
+        if self.swept:
+            goal1, goal2 = self._move_balls_swept(active)
+        else:
+            goal1, goal2 = self._move_balls(active)
+
+        # Забиті голи
+        self.score1 += goal1
+        self.score2 += goal2
+        scored = np.flatnonzero(goal1 | goal2)
+        if scored.size:
+            self.reset_balls(scored)
+
+        # Перевірка завершення ігор
+        self.game_over |= (self.score1 >= self.max_score) | (self.score2 >= self.max_score)
+
+    def _move_balls(self, active):
+        """Класичний крок PongEngine._move_ball() для всіх матчів."""
+        self.ball_x += self.ball_dx * (self.dt * active)
+        self.ball_y += self.ball_dy * (self.dt * active)
+        ball_center = self.ball_y + BALL_SIZE // 2
+
+        # Відбивання від верхньої та нижньої меж
+        wall = active & ((self.ball_y <= 0) | (self.ball_y + BALL_SIZE >= HEIGHT))
+        np.negative(self.ball_dy, out=self.ball_dy, where=wall)
+
+        # Відбивання від ракеток; два удари за крок скасовують один одного
+        hit1 = ((self.ball_x <= PADDLE1_FACE) &
+                (self.paddle1_y <= ball_center) & (ball_center <= self.paddle1_y + PADDLE_HEIGHT))
+        hit2 = ((self.ball_x >= PADDLE2_FACE) &
+                (self.paddle2_y <= ball_center) & (ball_center <= self.paddle2_y + PADDLE_HEIGHT))
+        np.negative(self.ball_dx, out=self.ball_dx, where=active & (hit1 ^ hit2))
+
+        goal2 = active & (self.ball_x <= 0)
+        goal1 = active & ~goal2 & (self.ball_x + BALL_SIZE >= WIDTH)
+        return goal1, goal2
+
+    def _move_balls_swept(self, active):
+        """Неперервний крок PongEngine._move_ball_swept() для всіх матчів.
+
+        Кожна ітерація обробляє одну найближчу подію в кожному матчі, що
+        ще має час у кроці; цикл триває, доки час не вичерпано скрізь.
+        """
+        goal1 = np.zeros(self.n, dtype=bool)
+        goal2 = np.zeros(self.n, dtype=bool)
+        remaining = np.where(active, float(self.dt), 0.0)
+        idx = np.flatnonzero(remaining > 0)
+        while idx.size:
+            x, y = self.ball_x[idx], self.ball_y[idx]
+            dx, dy = self.ball_dx[idx], self.ball_dy[idx]
+            t_event = remaining[idx]
+            event = np.full(idx.size, NO_HIT, dtype=np.int8)
+
+            # Верхня або нижня межа
+            t = np.where(dy < 0, -y, HEIGHT - BALL_SIZE - y) / dy
+            hit = t <= t_event
+            t_event = np.where(hit, t, t_event)
+            event[hit] = WALL_HIT
+
+            # Ракетки: удар у площину або вхід центру в проміжок ракетки за площиною
+            center = y + BALL_SIZE // 2
+            paddles = ((dx < 0, PADDLE1_FACE, self.paddle1_y[idx]),
+                       (dx > 0, PADDLE2_FACE, self.paddle2_y[idx]))
+            for toward, face, paddle_y in paddles:
+                t = (face - x) / dx
+                face_center = center + dy * t
+                hit = (toward & (t >= 0) & (t <= t_event) &
+                       (paddle_y <= face_center) & (face_center <= paddle_y + PADDLE_HEIGHT))
+                t_event = np.where(hit, t, t_event)
+                event[hit] = PADDLE_HIT
+
+                above = (dy > 0) & (center < paddle_y)
+                below = (dy < 0) & (center > paddle_y + PADDLE_HEIGHT)
+                t = np.where(above, paddle_y - center, paddle_y + PADDLE_HEIGHT - center) / dy
+                hit = (toward & (above | below) & (t <= t_event) &
+                       ((x + dx * t - face) * dx >= 0))
+                t_event = np.where(hit, t, t_event)
+                event[hit] = EDGE_HIT
+
+            # Лінії воріт
+            t = np.where(dx < 0, -x, WIDTH - BALL_SIZE - x) / dx
+            hit = t <= t_event
+            t_event = np.where(hit, t, t_event)
+            event[hit] = np.where(dx[hit] < 0, GOAL_LEFT, GOAL_RIGHT)
+
+            x = x + dx * t_event
+            y = y + dy * t_event
+            remaining[idx] -= t_event
+
+            wall = event == WALL_HIT
+            y[wall] = np.where(dy[wall] < 0, 0, HEIGHT - BALL_SIZE)
+            dy[wall] = -dy[wall]
+            paddle = event == PADDLE_HIT
+            x[paddle] = np.where(dx[paddle] < 0, PADDLE1_FACE, PADDLE2_FACE)
+            dx[paddle | (event == EDGE_HIT)] *= -1
+            self.ball_x[idx], self.ball_y[idx] = x, y
+            self.ball_dx[idx], self.ball_dy[idx] = dx, dy
+
+            # Гол завершує крок матчу
+            goal2[idx[event == GOAL_LEFT]] = True
+            goal1[idx[event == GOAL_RIGHT]] = True
+            remaining[idx[event >= GOAL_LEFT]] = 0
+            idx = idx[remaining[idx] > 0]
+        return goal1, goal2
+
+    def run(self, max_ticks, policy1=None, policy2=None):
+        """Грає всі матчі до кінця або max_ticks кадрів гри і повертає масив переможців."""
+        for _ in range(int(np.ceil(max_ticks / self.dt))):
+            if self.game_over.all():
+                break
+            self.step(policy_buttons(self, policy1, policy2))
+        return self.winner
+
+
+def compare_with_engine(seeds, max_ticks, policy1=None, policy2=None, max_score=MAX_SCORE,
+                        dt=1, swept=False):
+    """Грає ті самі матчі в BatchPong і в PongEngine; повертає сіди, де результати різняться."""
+    batch = BatchPong(seeds, max_score, dt, swept)
+    batch.run(max_ticks, policy1, policy2)
+    mismatches = []
+    for i, seed in enumerate(seeds):
+        engine = PongEngine(seed, max_score, dt, swept)
+        engine.run(max_ticks, policy1, policy2)
+        if ((engine.winner or 0, engine.score1, engine.score2, engine.tick) !=
+                (batch.winner[i], batch.score1[i], batch.score2[i], batch.tick[i])):
+            mismatches.append(seed)
+    return mismatches
+
+
+def paddle_range(dt, ticks=100):
+    """Крайні положення лівої ракетки, коли клавішу тримають угору, а потім униз.
+
+    Повертає пари (мінімум, максимум) для PongEngine і для BatchPong; за будь-якого
+    dt вони мають збігатися з діапазоном при dt=1.
+    """
+    engine = PongEngine(0, dt=dt)
+    batch = BatchPong([0], dt=dt)
+    engine_seen, batch_seen = {engine.paddle1_y}, {float(batch.paddle1_y[0])}
+    for buttons in (P1_UP,) * ticks + (P1_DOWN,) * ticks:
+        engine.apply_input(buttons)
+        batch.apply_input(np.array([buttons]))
+        engine_seen.add(engine.paddle1_y)
+        batch_seen.add(float(batch.paddle1_y[0]))
+    return (min(engine_seen), max(engine_seen)), (min(batch_seen), max(batch_seen))
+
+
+if __name__ == "__main__":
+    # Ракетка має діставати до тих самих меж за будь-якого кроку
+    expected = paddle_range(1)[0]
+    for dt in (1, 2.5, 4, 10, 30):
+        ranges = paddle_range(dt)
+        status = "ok" if ranges == (expected, expected) else "РОЗБІЖНІСТЬ"
+        print(f"Діапазон ракетки, dt={dt}: {ranges[0]} / {ranges[1]} - {status}")
+
+    # Звірка з поодиноким рушієм
+    seeds = list(range(200))
+    bad = compare_with_engine(seeds, 5000, track_ball, idle, max_score=3)
+    print(f"Розбіжностей з PongEngine: {len(bad)} з {len(seeds)}")
+
+    bad = compare_with_engine(seeds, 5000, track_ball, idle, max_score=3, dt=4, swept=True)
+    print(f"Розбіжностей з PongEngine (swept, dt=4): {len(bad)} з {len(seeds)}")
+
+    # Пропускна здатність: класичний крок і неперервні зіткнення з грубим кроком
+    n, ticks = 10000, 2000
+    for dt, swept in ((1, False), (4, True)):
+        batch = BatchPong(list(range(n)), max_score=3, dt=dt, swept=swept)
+        start = time.perf_counter()
+        winners = batch.run(ticks, track_ball, idle)
+        elapsed = time.perf_counter() - start
+        match_ticks = int(batch.tick.sum())
+        print(f"dt={dt}, swept={swept}: {n} матчів, {match_ticks} кадрів гри за {elapsed:.2f} с "
+              f"({match_ticks / elapsed:,.0f} кадрів/с)")
+        print(f"Перемоги: лівий {np.sum(winners == 1)}, правий {np.sum(winners == 2)}, "
+              f"не завершено {np.sum(winners == 0)}")
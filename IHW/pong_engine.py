@@ -0,0 +1,285 @@
+import random
+
+# Розміри поля
+WIDTH = 800
+HEIGHT = 400
+
+# Розміри ракеток і м'яча
+PADDLE_WIDTH = 10
+PADDLE_HEIGHT = 100
+BALL_SIZE = 20
+
+# Горизонтальні координати ракеток
+PADDLE1_X = 20
+PADDLE2_X = WIDTH - 20 - PADDLE_WIDTH
+
+# Швидкість
+PADDLE_SPEED = 20
+BALL_SPEED = 10
+
+# Максимальний рахунок
+MAX_SCORE = 1
+
+# Тривалість одного кроку симуляції в мілісекундах
+TICK_MS = 30
+
+# Площини, на яких м'яч торкається ракеток
+PADDLE1_FACE = PADDLE1_X + PADDLE_WIDTH
+PADDLE2_FACE = PADDLE2_X - BALL_SIZE
+
+# Поля, з яких складається стан гри (для знімків, повторів і мережі)
+STATE_FIELDS = ("paddle1_y", "paddle2_y", "ball_x", "ball_y", "ball_dx", "ball_dy",
+                "score1", "score2", "game_over", "tick")
+
+# Біти стану клавіш, які рушій читає раз на крок
+P1_UP, P1_DOWN, P2_UP, P2_DOWN = 1, 2, 4, 8
+
+# Події всередині кроку для неперервних зіткнень
+NO_HIT, WALL_HIT, PADDLE_HIT, EDGE_HIT, GOAL_LEFT, GOAL_RIGHT = range(6)
+
+
+# Межі ракетки: з центру кроками по PADDLE_SPEED вона доходить лише до них
+PADDLE_MIN_Y = (HEIGHT // 2 - PADDLE_HEIGHT // 2) % PADDLE_SPEED
+PADDLE_MAX_Y = PADDLE_MIN_Y + (HEIGHT - PADDLE_HEIGHT - PADDLE_MIN_Y) // PADDLE_SPEED * PADDLE_SPEED
+
+
+def paddle_travel(y, direction, dt):
+    """Нова позиція ракетки після руху в напрямку direction (-1, 0, 1) за dt кадрів.
+
+    Позиція обмежується [PADDLE_MIN_Y, PADDLE_MAX_Y] - крайніми точками, до
+    яких ракетка доходить з центру кроками по PADDLE_SPEED у межах поля, тож
+    за будь-якого dt діапазон руху той самий, що й при dt=1. Працює і з
+    числами, і з масивами NumPy.
+    """
+    y = y + direction * (PADDLE_SPEED * dt)
+    return y + (PADDLE_MIN_Y - y) * (y < PADDLE_MIN_Y) + (PADDLE_MAX_Y - y) * (y > PADDLE_MAX_Y)
+
+
+class PongEngine:
+    """Стан гри та правила без прив'язки до tkinter.
+
+    Один виклик step() просуває гру на dt кадрів по TICK_MS мс,
+    тому симуляцію можна ганяти без вікна з будь-якою швидкістю.
+
+    За замовчуванням зіткнення перевіряються в кінці кроку, як у
+    класичній грі. З swept=True рушій шукає точний момент удару
+    всередині кроку, тож м'яч не пролітає крізь ракетки навіть за
+    великого dt чи високої швидкості.
+    """
+
+    def __init__(self, seed=None, max_score=MAX_SCORE, dt=1, swept=False):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.max_score = max_score
+        self.dt = dt
+        self.swept = swept
+
+        self.paddle1_y = HEIGHT // 2 - PADDLE_HEIGHT // 2
+        self.paddle2_y = HEIGHT // 2 - PADDLE_HEIGHT // 2
+
+        self.ball_x = WIDTH // 2 - BALL_SIZE // 2
+        self.ball_y = HEIGHT // 2 - BALL_SIZE // 2
+        self.ball_dx = BALL_SPEED
+        self.ball_dy = BALL_SPEED
+
+        self.score1 = 0
+        self.score2 = 0
+        self.game_over = False
+        self.tick = 0
+
+    @property
+    def winner(self):
+        """Номер переможця (1 або 2) або None, поки гра триває."""
+        if not self.game_over:
+            return None
+        return 1 if self.score1 >= self.max_score else 2
+
+    def snapshot(self):
+        """Повний знімок стану разом зі станом генератора випадкових чисел."""
+        return tuple(getattr(self, name) for name in STATE_FIELDS) + (self.rng.getstate(),)
+
+    def restore(self, snapshot):
+        """Відновлює стан, збережений snapshot()."""
+        for name, value in zip(STATE_FIELDS, snapshot):
+            setattr(self, name, value)
+        self.rng.setstate(snapshot[-1])
+
+    def reset_ball(self):
+        """Повертає м'яч у центр і обирає випадковий напрямок подачі."""
+        self.ball_x = WIDTH // 2 - BALL_SIZE // 2
+        self.ball_y = HEIGHT // 2 - BALL_SIZE // 2
+        self.ball_dx = BALL_SPEED * self.rng.choice([-1, 1])
+        self.ball_dy = BALL_SPEED * self.rng.choice([-1, 1])
+
+    def apply_input(self, buttons):
+        """Рухає ракетки відповідно до натиснутих клавіш (бітова маска P1_UP...)."""
+        if self.game_over:
+            return
+        direction1 = -1 if buttons & P1_UP else 1 if buttons & P1_DOWN else 0
+        direction2 = -1 if buttons & P2_UP else 1 if buttons & P2_DOWN else 0
+        if direction1:
+            self.paddle1_y = paddle_travel(self.paddle1_y, direction1, self.dt)
+        if direction2:
+            self.paddle2_y = paddle_travel(self.paddle2_y, direction2, self.dt)
+
+    def step(self, buttons=0):
+        """Виконує один крок гри з заданим станом клавіш.
+
+        Повертає номер гравця, що забив, або 0.
+        """
+        if self.game_over:
+            return 0
+        self.tick += self.dt
+
+        if buttons:
+            self.apply_input(buttons)
+
+        if self.swept:
+            scored = self._move_ball_swept()
+        else:
+            scored = self._move_ball()
+
+        # Забитий гол: рахунок і нова подача
+        if scored == 1:
+            self.score1 += 1
+            self.reset_ball()
+        elif scored == 2:
+            self.score2 += 1
+            self.reset_ball()
+
+        # Перевірка завершення гри
+        if self.score1 >= self.max_score or self.score2 >= self.max_score:
+            self.game_over = True
+        return scored
+
+    def _move_ball(self):
+        """Класичний крок: зсув м'яча, потім перевірка перетинів."""
+        self.ball_x += self.ball_dx * self.dt
+        self.ball_y += self.ball_dy * self.dt
+        ball_center = self.ball_y + BALL_SIZE // 2
+
+        # Відбивання від верхньої та нижньої меж
+        if self.ball_y <= 0 or self.ball_y + BALL_SIZE >= HEIGHT:
+            self.ball_dy = -self.ball_dy
+
+        # Відбивання від лівої ракетки
+        if (self.ball_x <= PADDLE1_FACE and
+                self.paddle1_y <= ball_center <= self.paddle1_y + PADDLE_HEIGHT):
+            self.ball_dx = -self.ball_dx
+
+        # Відбивання від правої ракетки
+        if (self.ball_x >= PADDLE2_FACE and
+                self.paddle2_y <= ball_center <= self.paddle2_y + PADDLE_HEIGHT):
+            self.ball_dx = -self.ball_dx
+
+        # Гол ліворуч або праворуч
+        if self.ball_x <= 0:
+            return 2
+        if self.ball_x + BALL_SIZE >= WIDTH:
+            return 1
+        return 0
+
+    def _move_ball_swept(self):
+        """Неперервний крок: м'яч летить від події до події в межах dt.
+
+        На кожній ітерації шукається найближчий момент удару об стінку,
+        ракетку чи лінію воріт; м'яч переноситься точно туди, відбивається
+        й летить далі рештою часу кроку.
+        """
+        remaining = self.dt
+        while remaining > 0:
+            x, y = self.ball_x, self.ball_y
+            dx, dy = self.ball_dx, self.ball_dy
+            t_event, event = remaining, NO_HIT
+
+            # Верхня або нижня межа
+            if dy < 0:
+                t = -y / dy
+            else:
+                t = (HEIGHT - BALL_SIZE - y) / dy
+            if t <= t_event:
+                t_event, event = t, WALL_HIT
+
+            # Ракетки: удар у площину ракетки або, як у класичному кроці,
+            # вхід центру м'яча в проміжок ракетки вже за цією площиною
+            for toward, face, paddle_y in ((dx < 0, PADDLE1_FACE, self.paddle1_y),
+                                           (dx > 0, PADDLE2_FACE, self.paddle2_y)):
+                if not toward:
+                    continue
+                center = y + BALL_SIZE // 2
+                t = (face - x) / dx
+                if 0 <= t <= t_event and paddle_y <= center + dy * t <= paddle_y + PADDLE_HEIGHT:
+                    t_event, event = t, PADDLE_HIT
+                if dy > 0 and center < paddle_y:
+                    t = (paddle_y - center) / dy
+                elif dy < 0 and center > paddle_y + PADDLE_HEIGHT:
+                    t = (paddle_y + PADDLE_HEIGHT - center) / dy
+                else:
+                    continue
+                if t <= t_event and (x + dx * t - face) * dx >= 0:
+                    t_event, event = t, EDGE_HIT
+
+            # Лінії воріт
+            if dx < 0:
+                t = -x / dx
+                goal = GOAL_LEFT
+            else:
+                t = (WIDTH - BALL_SIZE - x) / dx
+                goal = GOAL_RIGHT
+            if t <= t_event:
+                t_event, event = t, goal
+
+            self.ball_x = x + dx * t_event
+            self.ball_y = y + dy * t_event
+            remaining -= t_event
+
+            if event == WALL_HIT:
+                self.ball_y = 0 if dy < 0 else HEIGHT - BALL_SIZE
+                self.ball_dy = -dy
+            elif event == PADDLE_HIT:
+                self.ball_x = PADDLE1_FACE if dx < 0 else PADDLE2_FACE
+                self.ball_dx = -dx
+            elif event == EDGE_HIT:
+                self.ball_dx = -dx
+            elif event == GOAL_LEFT:
+                return 2
+            elif event == GOAL_RIGHT:
+                return 1
+        return 0
+
+    def run(self, max_ticks, policy1=None, policy2=None):
+        """Крутить симуляцію без вікна до кінця гри або max_ticks кроків.
+
+        policy1/policy2 - стратегії ракеток: функції (стан, гравець),
+        що повертають напрямок руху -1, 0 або 1 на кожному кроці.
+        """
+        while not self.game_over and self.tick < max_ticks:
+            self.step(policy_buttons(self, policy1, policy2))
+        return self.winner
+
+
+# Перетворення напрямків руху ракеток (-1, 0, 1) на бітову маску клавіш.
+# Як і стратегії, працює і з числами, і з масивами NumPy.
+def encode_input(direction1, direction2):
+    return ((direction1 < 0) * P1_UP + (direction1 > 0) * P1_DOWN +
+            (direction2 < 0) * P2_UP + (direction2 > 0) * P2_DOWN)
+
+
+# Маска клавіш, яку на цьому кроці "натискають" стратегії гравців
+def policy_buttons(state, policy1, policy2):
+    direction1 = policy1(state, 1) if policy1 is not None else 0
+    direction2 = policy2(state, 2) if policy2 is not None else 0
+    return encode_input(direction1, direction2)
+
+
+# Проста стратегія: тягнути центр ракетки за центром м'яча.
+# Використовує лише арифметику, тож працює і з PongEngine, і з масивами BatchPong.
+def track_ball(state, player, dead_zone=PADDLE_HEIGHT // 4):
+    paddle_y = state.paddle1_y if player == 1 else state.paddle2_y
+    diff = (state.ball_y + BALL_SIZE // 2) - (paddle_y + PADDLE_HEIGHT // 2)
+    return (diff > dead_zone) * 1 - (diff < -dead_zone) * 1
+
+
+# Стратегія, що стоїть на місці
+def idle(state, player):
+    return 0
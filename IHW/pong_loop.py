@@ -0,0 +1,145 @@
+import math
+import time
+from collections import deque
+
+from pong_engine import TICK_MS
+
+# Межі кошиків гістограми джитера, мс: [0, 1), [1, 2), [2, 5), ... , [20, ∞)
+JITTER_BUCKETS = (1, 2, 5, 10, 20)
+
+
+class LoopMetrics:
+    """Живі метрики ігрового циклу: кроки/с, перцентилі часу кадру та джитер."""
+
+    def __init__(self, tick_ms=TICK_MS, history=300):
+        self.tick_ms = tick_ms
+        self.frame_times = deque(maxlen=history)   # тривалість обробки кадру, мс
+        self.tick_stamps = deque()                 # (момент кадру, кроків у кадрі)
+        self.jitter = [0] * (len(JITTER_BUCKETS) + 1)
+        self.last_frame_at = None
+        self.total_ticks = 0
+        self.dropped_ticks = 0
+
+    def record(self, started, finished, ticks, dropped=0):
+        """Записує один кадр: час початку і кінця (с), виконані й відкинуті кроки."""
+        self.frame_times.append((finished - started) * 1000)
+        self.total_ticks += ticks
+        self.dropped_ticks += dropped
+
+        # Кроки за останню секунду
+        self.tick_stamps.append((started, ticks))
+        while self.tick_stamps and started - self.tick_stamps[0][0] > 1.0:
+            self.tick_stamps.popleft()
+
+        # Відхилення інтервалу між кадрами від номінального кроку
+        if self.last_frame_at is not None:
+            deviation = abs((started - self.last_frame_at) * 1000 - self.tick_ms)
+            bucket = 0
+            while bucket < len(JITTER_BUCKETS) and deviation >= JITTER_BUCKETS[bucket]:
+                bucket += 1
+            self.jitter[bucket] += 1
+        self.last_frame_at = started
+
+    def ticks_per_second(self):
+        if len(self.tick_stamps) < 2:
+            return 0.0
+        span = self.tick_stamps[-1][0] - self.tick_stamps[0][0]
+        ticks = sum(ticks for _, ticks in self.tick_stamps) - self.tick_stamps[0][1]
+        return ticks / span if span > 0 else 0.0
+
+    def percentile(self, p):
+        """p-й перцентиль часу обробки кадру в мілісекундах."""
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def jitter_histogram(self):
+        """Пари (підпис кошика, кількість кадрів)."""
+        labels = []
+        low = 0
+        for high in JITTER_BUCKETS:
+            labels.append(f"{low}-{high}ms")
+            low = high
+        labels.append(f">={low}ms")
+        return list(zip(labels, self.jitter))
+
+    def summary(self):
+        """Кілька рядків для накладки на Canvas."""
+        histogram = " ".join(f"{label}:{count}" for label, count in self.jitter_histogram())
+        return (f"{self.ticks_per_second():.1f} ticks/s  dropped {self.dropped_ticks}\n"
+                f"frame p50 {self.percentile(50):.2f}  p95 {self.percentile(95):.2f}  "
+                f"p99 {self.percentile(99):.2f} ms\n"
+                f"jitter {histogram}")
+
+
+class GameLoop:
+    """Єдиний планувальник ігрового циклу з компенсацією дрейфу.
+
+    Кроки симуляції виконуються за реальним часом: якщо кадр запізнився,
+    цикл доганяє пропущені кроки (не більше max_catch_up за кадр), а
+    наступний кадр планується на момент чергового кроку, а не через
+    фіксовані tick_ms після завершення поточного. Повторний start() на
+    працюючому циклі нічого не робить, тож двох циклів бути не може.
+
+    step() повертає False, коли гру завершено, і цикл зупиняється.
+    """
+
+    def __init__(self, window, step, render, tick_ms=TICK_MS, max_catch_up=5,
+                 clock=time.perf_counter):
+        self.window = window
+        self.step = step
+        self.render = render
+        self.tick = tick_ms / 1000
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.metrics = LoopMetrics(tick_ms)
+        self._after_id = None
+        self._next_tick_at = 0.0
+
+    @property
+    def running(self):
+        return self._after_id is not None
+
+    def start(self):
+        if self.running:
+            return
+        self._next_tick_at = self.clock() + self.tick
+        self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self):
+        # Округлення вгору: таймер, що спрацював раніше кроку, дав би порожній кадр
+        delay_ms = max(0, math.ceil((self._next_tick_at - self.clock()) * 1000))
+        self._after_id = self.window.after(delay_ms, self._frame)
+
+    def _frame(self):
+        self._after_id = None
+        started = self.clock()
+
+        # Наздоганяємо всі кроки, час яких уже настав
+        ticks = 0
+        alive = True
+        while alive and started >= self._next_tick_at and ticks < self.max_catch_up:
+            alive = self.step()
+            self._next_tick_at += self.tick
+            ticks += 1
+
+        # Якщо відставання завелике, відкидаємо його, щоб не зависнути в доганянні
+        dropped = 0
+        if started >= self._next_tick_at:
+            dropped = int((started - self._next_tick_at) / self.tick) + 1
+            self._next_tick_at += dropped * self.tick
+
+        # Ранній кадр без кроків лише переплановується: його не малюємо й не міряємо
+        if ticks or dropped:
+            self.render()
+            self.metrics.record(started, self.clock(), ticks, dropped)
+
+        if alive:
+            self._schedule()
@@ -0,0 +1,341 @@
+import argparse
+import asyncio
+import multiprocessing
+import random
+import struct
+import time
+from collections import deque
+
+from pong_engine import (PongEngine, STATE_FIELDS, WIDTH, TICK_MS, MAX_SCORE,
+                         P1_UP, P1_DOWN, P2_UP, P2_DOWN)
+
+# Поля знімка, які передаються в дельтах, і їхні формати struct
+NET_FIELDS = tuple(name for name in STATE_FIELDS if name != "tick")
+FIELD_FORMATS = {"score1": "H", "score2": "H", "game_over": "?"}
+
+# Заголовок знімка: номер кроку і бітова маска змінених полів
+SNAPSHOT_HEADER = struct.Struct("<IH")
+# Привітання сервера: номер гравця (1 або 2) і тривалість кроку в мс
+HELLO = struct.Struct("<BH")
+
+# Біти клавіш, які має право "натискати" кожен гравець
+PLAYER_BITS = {1: P1_UP | P1_DOWN, 2: P2_UP | P2_DOWN}
+
+# Останні кроки сервера, за якими рахуються перцентилі (~5 хв при 30 мс)
+CPU_HISTORY = 10000
+
+_delta_structs = {}
+
+
+def delta_struct(mask):
+    """struct для значень полів, позначених у mask (кешується)."""
+    packer = _delta_structs.get(mask)
+    if packer is None:
+        fmt = "<" + "".join(FIELD_FORMATS.get(name, "f")
+                            for bit, name in enumerate(NET_FIELDS) if mask >> bit & 1)
+        packer = _delta_structs[mask] = struct.Struct(fmt)
+    return packer
+
+
+def encode_delta(tick, state, previous):
+    """Пакує поля state, що відрізняються від previous (None - повний знімок).
+
+    Повертає байти знімка і нові значення полів для наступного порівняння.
+    """
+    values = tuple(getattr(state, name) for name in NET_FIELDS)
+    mask = 0
+    changed = []
+    for bit, value in enumerate(values):
+        if previous is None or previous[bit] != value:
+            mask |= 1 << bit
+            changed.append(value)
+    return SNAPSHOT_HEADER.pack(tick, mask) + delta_struct(mask).pack(*changed), values
+
+
+class NetState:
+    """Стан гри на боці клієнта з тими самими назвами полів, що в PongEngine."""
+
+    def __init__(self):
+        engine = PongEngine()
+        for name in NET_FIELDS:
+            setattr(self, name, getattr(engine, name))
+        self.tick = 0
+
+    @property
+    def winner(self):
+        """Переможець за рахунком (гол за крок лише один, тож нічиєї немає)."""
+        if not self.game_over:
+            return None
+        return 1 if self.score1 > self.score2 else 2
+
+    def copy(self):
+        state = NetState.__new__(NetState)
+        state.__dict__.update(self.__dict__)
+        return state
+
+
+class Match:
+    """Одна гра на сервері: рушій, два гравці та їхні поточні клавіші."""
+
+    def __init__(self, seed=None, max_score=MAX_SCORE):
+        self.engine = PongEngine(seed, max_score)
+        self.writers = {}
+        self.buttons = {1: 0, 2: 0}
+        self.sent = {}
+
+    @property
+    def full(self):
+        return len(self.writers) == 2
+
+
+class PongServer:
+    """Авторитетний сервер: рахує гру сам і розсилає клієнтам бінарні дельти.
+
+    Клієнти надсилають по одному байту - маску своїх клавіш - щоразу, коли
+    вона змінюється. Кожні tick_ms сервер робить крок у всіх повних матчах і
+    пише кожному гравцеві лише поля, що змінилися з попереднього знімка.
+    """
+
+    def __init__(self, tick_ms=TICK_MS, max_score=MAX_SCORE):
+        self.tick = tick_ms / 1000
+        self.tick_ms = tick_ms
+        self.max_score = max_score
+        self.matches = []
+        self.waiting = None
+        self.players = 0
+        self.peak_players = 0
+        self.tick_cpu = deque(maxlen=CPU_HISTORY)  # процесорний час останніх кроків, с
+        self.cpu_total = 0.0
+        self.cpu_max = 0.0
+        self.bytes_sent = 0
+        self.ticks = 0
+
+    async def handle_client(self, reader, writer):
+        # Пара для нового гравця: матч, що чекає на суперника, або новий
+        if self.waiting is None:
+            self.waiting = Match(max_score=self.max_score)
+            self.matches.append(self.waiting)
+        match = self.waiting
+        player = 1 if 1 not in match.writers else 2
+        match.writers[player] = writer
+        if match.full:
+            self.waiting = None
+        writer.write(HELLO.pack(player, self.tick_ms))
+        self.players += 1
+        self.peak_players = max(self.peak_players, self.players)
+
+        try:
+            while True:
+                data = await reader.read(64)
+                if not data:
+                    break
+                # Важить лише останній стан клавіш у пачці
+                match.buttons[player] = data[-1] & PLAYER_BITS[player]
+        except ConnectionError:
+            pass
+        finally:
+            self.players -= 1
+            match.writers.pop(player, None)
+            match.sent.pop(player, None)
+            opponent = match.writers.get(3 - player)
+            if opponent is not None and self.waiting is not match:
+                # Суперник перемагає технічно: кінцевий стан і закриття з'єднання
+                self.forfeit(match, 3 - player)
+                opponent.close()
+            if not match.writers and match in self.matches:
+                self.matches.remove(match)
+                if self.waiting is match:
+                    self.waiting = None
+            writer.close()
+
+    def forfeit(self, match, winner):
+        """Завершує матч перемогою winner і надсилає йому кінцевий стан."""
+        engine = match.engine
+        if engine.game_over:
+            return
+        setattr(engine, f"score{winner}", max(engine.max_score, engine.score1, engine.score2))
+        engine.game_over = True
+        packet, match.sent[winner] = encode_delta(engine.tick, engine, match.sent.get(winner))
+        match.writers[winner].write(packet)
+        self.bytes_sent += len(packet)
+
+    def step_all(self):
+        """Один крок сервера: симуляція всіх матчів і розсилання дельт."""
+        cpu_start = time.process_time()
+        for match in self.matches:
+            if not match.full:
+                continue
+            engine = match.engine
+            if engine.game_over and len(match.sent) == 2:
+                continue  # Кінцевий стан уже розіслано
+            engine.step(match.buttons[1] | match.buttons[2])
+            for player, writer in match.writers.items():
+                packet, match.sent[player] = encode_delta(engine.tick, engine,
+                                                          match.sent.get(player))
+                writer.write(packet)
+                self.bytes_sent += len(packet)
+        cpu = time.process_time() - cpu_start
+        self.tick_cpu.append(cpu)
+        self.cpu_total += cpu
+        self.cpu_max = max(self.cpu_max, cpu)
+        self.ticks += 1
+
+    async def run(self, host="127.0.0.1", port=5555, duration=None, ready=None):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        if ready is not None:
+            ready.set()
+        loop = asyncio.get_running_loop()
+        started = next_tick = loop.time()
+        async with server:
+            while duration is None or loop.time() - started < duration:
+                # Крок за розкладом без накопичення дрейфу
+                next_tick += self.tick
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+                self.step_all()
+
+    def report(self):
+        if not self.tick_cpu:
+            return "Сервер не зробив жодного кроку."
+        # Середнє й максимум - за весь час, перцентилі - за останні CPU_HISTORY кроків
+        ordered = sorted(self.tick_cpu)
+        mean = self.cpu_total / self.ticks
+        return (f"кроків: {self.ticks}, гравців одночасно: до {self.peak_players}\n"
+                f"CPU на крок: середнє {mean * 1000:.3f} мс, "
+                f"p50 {ordered[len(ordered) // 2] * 1000:.3f} мс, "
+                f"p99 {ordered[int(len(ordered) * 0.99)] * 1000:.3f} мс, "
+                f"макс {self.cpu_max * 1000:.3f} мс\n"
+                f"відправлено {self.bytes_sent} байт "
+                f"({self.bytes_sent / max(1, self.ticks):.0f} байт/крок)")
+
+
+class PongClient:
+    """Клієнт: надсилає клавіші, приймає дельти й інтерполює стан між знімками."""
+
+    def __init__(self):
+        self.player = None
+        self.tick = TICK_MS / 1000
+        self.state = NetState()
+        self.previous = self.state.copy()
+        self.received_at = self.previous_at = time.perf_counter()
+        self.buttons = 0
+        self.reader = self.writer = None
+        self.snapshots = 0
+
+    async def connect(self, host="127.0.0.1", port=5555):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.player, tick_ms = HELLO.unpack(await self.reader.readexactly(HELLO.size))
+        self.tick = tick_ms / 1000
+
+    def send_input(self, buttons):
+        """Надсилає маску клавіш, лише якщо вона змінилася."""
+        buttons &= PLAYER_BITS[self.player]
+        if buttons != self.buttons and self.writer is not None:
+            self.buttons = buttons
+            self.writer.write(bytes([buttons]))
+
+    async def receive(self):
+        """Приймає знімки до закриття з'єднання."""
+        read = self.reader.readexactly
+        try:
+            while True:
+                tick, mask = SNAPSHOT_HEADER.unpack(await read(SNAPSHOT_HEADER.size))
+                packer = delta_struct(mask)
+                values = packer.unpack(await read(packer.size)) if packer.size else ()
+                self.apply(tick, mask, values)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    def apply(self, tick, mask, values):
+        self.previous, self.previous_at = self.state.copy(), self.received_at
+        self.received_at = time.perf_counter()
+        changed = iter(values)
+        for bit, name in enumerate(NET_FIELDS):
+            if mask >> bit & 1:
+                setattr(self.state, name, next(changed))
+        self.state.tick = tick
+        self.snapshots += 1
+
+    def interpolated(self, now=None):
+        """Стан для відмальовування: на один крок позаду, плавно між двома знімками."""
+        if now is None:
+            now = time.perf_counter()
+        span = self.received_at - self.previous_at
+        if span <= 0:
+            return self.state
+        alpha = min(1.0, max(0.0, (now - self.tick - self.previous_at) / span))
+        state = self.state.copy()
+        # Після гола м'яч телепортується в центр - туди не інтерполюємо
+        if abs(self.state.ball_x - self.previous.ball_x) < WIDTH // 4:
+            for name in ("ball_x", "ball_y"):
+                old, new = getattr(self.previous, name), getattr(self.state, name)
+                setattr(state, name, old + (new - old) * alpha)
+        for name in ("paddle1_y", "paddle2_y"):
+            old, new = getattr(self.previous, name), getattr(self.state, name)
+            setattr(state, name, old + (new - old) * alpha)
+        return state
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _serve_process(port, duration, tick_ms, ready, results):
+    # Довгі матчі, щоб усі гравці грали до кінця тесту
+    server = PongServer(tick_ms, max_score=1000)
+    asyncio.run(server.run(port=port, duration=duration, ready=ready))
+    results.put(server.report())
+
+
+async def _bot(port, duration, stats):
+    """Симульований гравець: випадково тисне клавіші, поки триває тест."""
+    client = PongClient()
+    await client.connect(port=port)
+    receiver = asyncio.ensure_future(client.receive())
+    rng = random.Random()
+    up, down = (P1_UP, P1_DOWN) if client.player == 1 else (P2_UP, P2_DOWN)
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        client.send_input(rng.choice((0, up, down)))
+        await asyncio.sleep(rng.uniform(0.05, 0.3))
+    client.close()
+    await receiver
+    stats.append(client.snapshots)
+
+
+async def _load_clients(port, clients, duration):
+    stats = []
+    await asyncio.gather(*(_bot(port, duration, stats) for _ in range(clients)))
+    return stats
+
+
+def load_test(clients=200, duration=10.0, port=5555, tick_ms=TICK_MS):
+    """Запускає сервер в окремому процесі й clients ботів через loopback.
+
+    Звіт сервера містить процесорний час на крок, тож видно ціну
+    симуляції та розсилання без урахування роботи самих клієнтів.
+    """
+    ready = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve_process,
+                                     args=(port, duration + 1.0, tick_ms, ready, results))
+    server.start()
+    ready.wait()
+    snapshots = asyncio.run(_load_clients(port, clients, duration))
+    report = results.get()
+    server.join()
+    print(f"Клієнтів: {clients}, знімків на клієнта: "
+          f"{sum(snapshots) / max(1, len(snapshots)):.0f} за {duration} с")
+    print(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ping-pong network server")
+    parser.add_argument("mode", choices=("serve", "loadtest"))
+    parser.add_argument("--port", type=int, default=5555)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+    if args.mode == "serve":
+        asyncio.run(PongServer().run("0.0.0.0", args.port))
+    else:
+        load_test(args.clients, args.seconds, args.port)
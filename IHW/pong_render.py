@@ -0,0 +1,183 @@
+import io
+import sys
+import time
+
+from pong_engine import (PongEngine, WIDTH, HEIGHT, PADDLE_WIDTH, PADDLE_HEIGHT,
+                         BALL_SIZE, PADDLE1_X, PADDLE2_X)
+from pong_ai import PredictiveAI
+
+
+def winner_text(winner):
+    return f"{'Лівий гравець' if winner == 1 else 'Правий гравець'} переміг!"
+
+
+class Renderer:
+    """Спільний інтерфейс бекендів малювання.
+
+    draw(state, overlay) викликається раз на кадр зі станом гри (PongEngine
+    або будь-який об'єкт з тими самими полями) і необов'язковим текстом
+    накладки. Лічильники calls/frames дозволяють міряти ціну малювання
+    окремо від ціни симуляції.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.calls = 0          # звернень до бекенду за весь час
+        self.frame_calls = 0    # звернень за останній кадр
+
+    def draw(self, state, overlay=None):
+        self.frames += 1
+        self.frame_calls = self._draw(state, overlay)
+        self.calls += self.frame_calls
+
+    def _draw(self, state, overlay):
+        raise NotImplementedError
+
+    def calls_per_frame(self):
+        return self.calls / self.frames if self.frames else 0.0
+
+
+class NullRenderer(Renderer):
+    """Нічого не малює: для замірів чистої ціни симуляції."""
+
+    def _draw(self, state, overlay):
+        return 0
+
+
+class TkRenderer(Renderer):
+    """Малювання на tkinter.Canvas, що передає лише змінені елементи.
+
+    Для кожного елемента запам'ятовується останнє відправлене значення,
+    тож нерухома ракетка чи незмінний рахунок не коштують жодного виклику Tk.
+    """
+
+    def __init__(self, canvas):
+        super().__init__()
+        self.canvas = canvas
+        self.paddle1 = canvas.create_rectangle(0, 0, 0, 0, fill="white")
+        self.paddle2 = canvas.create_rectangle(0, 0, 0, 0, fill="white")
+        self.ball = canvas.create_oval(0, 0, 0, 0, fill="white")
+        self.score_text = canvas.create_text(WIDTH // 2, 20, text="0 : 0",
+                                             font=("Arial", 24), fill="white")
+        self.overlay_text = canvas.create_text(10, HEIGHT - 10, text="", anchor="sw",
+                                               font=("Courier", 9), fill="gray",
+                                               state="hidden")
+        self.winner_item = None
+        self.pushed = {self.score_text: "0 : 0", self.overlay_text: None}
+
+    def _coords(self, item, *coords):
+        if self.pushed.get(item) == coords:
+            return 0
+        self.pushed[item] = coords
+        self.canvas.coords(item, *coords)
+        return 1
+
+    def _text(self, item, text):
+        if self.pushed.get(item) == text:
+            return 0
+        previous = self.pushed.get(item)
+        self.pushed[item] = text
+        if text is None:
+            self.canvas.itemconfig(item, state="hidden")
+        elif previous is None:
+            self.canvas.itemconfig(item, text=text, state="normal")
+        else:
+            self.canvas.itemconfig(item, text=text)
+        return 1
+
+    def _draw(self, state, overlay):
+        calls = self._coords(self.paddle1, PADDLE1_X, state.paddle1_y,
+                             PADDLE1_X + PADDLE_WIDTH, state.paddle1_y + PADDLE_HEIGHT)
+        calls += self._coords(self.paddle2, PADDLE2_X, state.paddle2_y,
+                              PADDLE2_X + PADDLE_WIDTH, state.paddle2_y + PADDLE_HEIGHT)
+        calls += self._coords(self.ball, state.ball_x, state.ball_y,
+                              state.ball_x + BALL_SIZE, state.ball_y + BALL_SIZE)
+        calls += self._text(self.score_text, f"{state.score1} : {state.score2}")
+        calls += self._text(self.overlay_text, overlay)
+        if state.game_over and self.winner_item is None:
+            self.winner_item = self.canvas.create_text(
+                WIDTH // 2, HEIGHT // 2, text=winner_text(state.winner),
+                font=("Times new roman", 36), fill="white")
+            calls += 1
+        return calls
+
+
+class TextRenderer(Renderer):
+    """Малювання символами в терміналі (або будь-якому текстовому потоці).
+
+    Кадр перерисовується цілком одним write(), але лише тоді, коли
+    його вміст відрізняється від попереднього.
+    """
+
+    def __init__(self, stream=None, columns=80, rows=20):
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stdout
+        self.columns = columns
+        self.rows = rows
+        self.last_frame = None
+
+    def _cell(self, x, y):
+        column = min(self.columns - 1, max(0, int(x * self.columns / WIDTH)))
+        row = min(self.rows - 1, max(0, int(y * self.rows / HEIGHT)))
+        return row, column
+
+    def _draw(self, state, overlay):
+        grid = [[" "] * self.columns for _ in range(self.rows)]
+        for x, y in ((PADDLE1_X, state.paddle1_y), (PADDLE2_X, state.paddle2_y)):
+            top, column = self._cell(x, y)
+            bottom, _ = self._cell(x, y + PADDLE_HEIGHT - 1)
+            for row in range(top, bottom + 1):
+                grid[row][column] = "|"
+        row, column = self._cell(state.ball_x + BALL_SIZE // 2, state.ball_y + BALL_SIZE // 2)
+        grid[row][column] = "o"
+
+        lines = [f"{state.score1} : {state.score2}".center(self.columns)]
+        lines.append("+" + "-" * self.columns + "+")
+        lines.extend("|" + "".join(row) + "|" for row in grid)
+        lines.append("+" + "-" * self.columns + "+")
+        if state.game_over:
+            lines.append(winner_text(state.winner).center(self.columns))
+        if overlay:
+            lines.append(overlay)
+        frame = "\n".join(lines)
+
+        if frame == self.last_frame:
+            return 0
+        self.last_frame = frame
+        # Курсор у лівий верхній кут і весь кадр одним записом
+        self.stream.write("\x1b[H" + frame + "\n")
+        self.stream.flush()
+        return 1
+
+
+def benchmark(renderer, ticks=20000, seed=1):
+    """Окремо міряє ціну кроків симуляції та малювання для бекенду."""
+    engine = PongEngine(seed, max_score=10 ** 6)
+    ai1, ai2 = PredictiveAI(4, 25, seed=1), PredictiveAI(4, 25, seed=2)
+    simulate = draw = 0.0
+    for _ in range(ticks):
+        started = time.perf_counter()
+        engine.run(engine.tick + 1, ai1, ai2)
+        drawn = time.perf_counter()
+        renderer.draw(engine)
+        finished = time.perf_counter()
+        simulate += drawn - started
+        draw += finished - drawn
+    print(f"{type(renderer).__name__}: симуляція {simulate / ticks * 1e6:.1f} мкс/кадр, "
+          f"малювання {draw / ticks * 1e6:.1f} мкс/кадр, "
+          f"{renderer.calls_per_frame():.2f} звернень/кадр")
+
+
+if __name__ == "__main__":
+    benchmark(NullRenderer())
+    benchmark(TextRenderer(io.StringIO()))
+    try:
+        import tkinter as tk
+        window = tk.Tk()
+    except Exception:
+        print("TkRenderer: немає дисплея, пропущено")
+    else:
+        canvas = tk.Canvas(window, width=WIDTH, height=HEIGHT, bg="black")
+        canvas.pack()
+        benchmark(TkRenderer(canvas))
+        window.destroy()
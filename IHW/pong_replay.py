@@ -0,0 +1,183 @@
+import glob
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+from pong_engine import PongEngine, STATE_FIELDS, MAX_SCORE
+
+# Заголовок файлу повтору: сигнатура, сід, max_score, dt, swept,
+# кількість кроків і контрольна сума кінцевого стану
+HEADER = struct.Struct("<8sQHdBII")
+MAGIC = b"PONGRPL1"
+
+# Знімок стану для перемотування робиться кожні SNAPSHOT_EVERY кроків
+SNAPSHOT_EVERY = 1000
+
+
+def state_checksum(engine):
+    """CRC32 стану гри (без генератора), щоб звіряти повтор з оригіналом."""
+    values = ",".join(repr(getattr(engine, name)) for name in STATE_FIELDS)
+    return zlib.crc32(values.encode())
+
+
+class Replay:
+    """Запис матчу: параметри рушія і маски клавіш, по 4 біти на крок.
+
+    Два кроки пакуються в один байт array('B'), тож година гри
+    (~120 000 кроків) займає 60 КБ, а після zlib - кілька кілобайт.
+    """
+
+    def __init__(self, seed, max_score=MAX_SCORE, dt=1, swept=False):
+        self.seed = seed
+        self.max_score = max_score
+        self.dt = dt
+        self.swept = swept
+        self.inputs = array("B")
+        self.length = 0
+        self.final_checksum = 0
+
+    def append(self, buttons):
+        if self.length % 2 == 0:
+            self.inputs.append(buttons & 0x0F)
+        else:
+            self.inputs[-1] |= (buttons & 0x0F) << 4
+        self.length += 1
+
+    def buttons(self, index):
+        """Маска клавіш на кроці index."""
+        packed = self.inputs[index >> 1]
+        return (packed >> 4) if index & 1 else (packed & 0x0F)
+
+    def new_engine(self):
+        return PongEngine(self.seed, self.max_score, self.dt, self.swept)
+
+    def to_bytes(self):
+        header = HEADER.pack(MAGIC, self.seed, self.max_score, self.dt, self.swept,
+                             self.length, self.final_checksum)
+        return header + zlib.compress(self.inputs.tobytes(), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, seed, max_score, dt, swept, length, checksum = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a Ping-pong replay file")
+        replay = cls(seed, max_score, int(dt) if dt.is_integer() else dt, bool(swept))
+        replay.inputs.frombytes(zlib.decompress(data[HEADER.size:]))
+        replay.length = length
+        replay.final_checksum = checksum
+        return replay
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """Обгортка над рушієм, що записує маску клавіш кожного кроку."""
+
+    def __init__(self, engine):
+        if not isinstance(engine.seed, int):
+            raise ValueError("Recording needs an engine created with an integer seed")
+        # Перевірка до гри: інакше матч зіграється й упаде лише в HEADER.pack
+        if not 0 <= engine.seed < 2 ** 64:
+            raise ValueError(f"Replay seed must be in [0, 2**64), got {engine.seed}")
+        if not 0 <= engine.max_score < 2 ** 16:
+            raise ValueError(f"Replay max_score must be in [0, 2**16), got {engine.max_score}")
+        self.engine = engine
+        self.replay = Replay(engine.seed, engine.max_score, engine.dt, engine.swept)
+
+    def step(self, buttons=0):
+        if self.engine.game_over:
+            return 0
+        self.replay.append(buttons)
+        return self.engine.step(buttons)
+
+    def finish(self):
+        """Закриває запис контрольною сумою поточного стану й повертає повтор."""
+        self.replay.final_checksum = state_checksum(self.engine)
+        return self.replay
+
+
+class ReplayPlayer:
+    """Відтворення повтору: покроково, на максимальній швидкості та з перемотуванням."""
+
+    def __init__(self, replay, snapshot_every=SNAPSHOT_EVERY):
+        self.replay = replay
+        self.engine = replay.new_engine()
+        self.position = 0
+        self.snapshot_every = snapshot_every
+        self.snapshots = {0: self.engine.snapshot()}
+
+    @property
+    def finished(self):
+        return self.position >= self.replay.length
+
+    def step(self):
+        """Відтворює один крок; повертає номер гравця, що забив, або 0."""
+        if self.finished:
+            return 0
+        scored = self.engine.step(self.replay.buttons(self.position))
+        self.position += 1
+        if self.position % self.snapshot_every == 0:
+            self.snapshots.setdefault(self.position, self.engine.snapshot())
+        return scored
+
+    def fast_forward(self, position=None):
+        """Програє повтор без вікна до кроку position (або до кінця)."""
+        if position is None:
+            position = self.replay.length
+        position = min(position, self.replay.length)
+        engine, buttons, every = self.engine, self.replay.buttons, self.snapshot_every
+        while self.position < position:
+            engine.step(buttons(self.position))
+            self.position += 1
+            if self.position % every == 0 and self.position not in self.snapshots:
+                self.snapshots[self.position] = engine.snapshot()
+        return engine
+
+    def seek(self, position):
+        """Переходить до кроку position від найближчого попереднього знімка."""
+        position = max(0, min(position, self.replay.length))
+        if not (self.position <= position and
+                position - self.position < self.snapshot_every):
+            start = max(tick for tick in self.snapshots if tick <= position)
+            self.engine.restore(self.snapshots[start])
+            self.position = start
+        return self.fast_forward(position)
+
+    def verify(self):
+        """Чи дає повтор той самий кінцевий стан, що й під час запису."""
+        self.fast_forward()
+        return state_checksum(self.engine) == self.replay.final_checksum
+
+
+def check_library(directory):
+    """Програє всі повтори з каталогу; повертає список файлів, що розійшлися з записом."""
+    failed = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.pongreplay"))):
+        if not ReplayPlayer(Replay.load(path)).verify():
+            failed.append(path)
+    return failed
+
+
+if __name__ == "__main__":
+    # Перевірка бібліотеки повторів: python pong_replay.py <каталог або файл>...
+    for target in sys.argv[1:]:
+        paths = [target] if os.path.isfile(target) else sorted(
+            glob.glob(os.path.join(target, "*.pongreplay")))
+        for path in paths:
+            replay = Replay.load(path)
+            start = time.perf_counter()
+            ok = ReplayPlayer(replay).verify()
+            elapsed = time.perf_counter() - start
+            print(f"{path}: {replay.length} кроків, {os.path.getsize(path)} байт, "
+                  f"{replay.length / max(elapsed, 1e-9):,.0f} кроків/с - "
+                  f"{'OK' if ok else 'РОЗБІЖНІСТЬ'}")
@@ -0,0 +1,208 @@
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from pong_engine import PongEngine, track_ball, idle
+from pong_ai import PredictiveAI
+
+try:
+    from pong_batch import BatchPong
+except ImportError:  # Без NumPy матчі грають по одному в PongEngine
+    BatchPong = None
+
+# Стратегії-учасники: назва -> параметри (мають пікластися для процесів)
+STRATEGIES = {
+    "idle": {"kind": "idle"},
+    "track": {"kind": "track"},
+    "ai-perfect": {"kind": "ai"},
+    "ai-r4-e25": {"kind": "ai", "reaction_ticks": 4, "error": 25.0},
+    "ai-r10-e40": {"kind": "ai", "reaction_ticks": 10, "error": 40.0},
+}
+
+ELO_START = 1500.0
+ELO_K = 16.0
+
+
+def make_policy(spec, seed):
+    """Створює стратегію ракетки за її описом."""
+    kind = spec["kind"]
+    if kind == "idle":
+        return idle
+    if kind == "track":
+        return track_ball
+    if kind == "ai":
+        return PredictiveAI(spec.get("reaction_ticks", 0), spec.get("error", 0.0), seed=seed)
+    raise ValueError(f"Unknown strategy kind: {kind}")
+
+
+# Поля, що визначають пачку: за ними перезапуск знаходить уже зіграні
+RESULT_KEY = ("a", "b", "seed", "games", "max_score", "max_ticks")
+
+
+def result_key(result):
+    return tuple(result[key] for key in RESULT_KEY)
+
+
+def play_task(task):
+    """Грає пачку матчів між двома стратегіями в окремому процесі.
+
+    Повертає task, доповнений рядком результатів: по символу на гру -
+    "1"/"2" для переможця або "0", якщо гра не завершилась за max_ticks.
+    """
+    specs = task["specs"]
+    seeds = list(range(task["seed"], task["seed"] + task["games"]))
+    if BatchPong is not None:
+        batch = BatchPong(seeds, task["max_score"])
+        winners = batch.run(task["max_ticks"],
+                            make_policy(specs[0], task["seed"]),
+                            make_policy(specs[1], task["seed"] + 1))
+        outcomes = "".join(map(str, winners.tolist()))
+    else:
+        outcomes = []
+        for seed in seeds:
+            engine = PongEngine(seed, task["max_score"])
+            engine.run(task["max_ticks"], make_policy(specs[0], seed), make_policy(specs[1], seed + 1))
+            outcomes.append(str(engine.winner or 0))
+        outcomes = "".join(outcomes)
+    return {key: task[key] for key in RESULT_KEY} | {"outcomes": outcomes}
+
+
+class Standings:
+    """Накопичувальні результати: перемоги, нічиї та рейтинг Ело."""
+
+    def __init__(self, names):
+        self.elo = {name: ELO_START for name in names}
+        self.wins = {name: 0 for name in names}
+        self.draws = {name: 0 for name in names}
+        self.games = {name: 0 for name in names}
+        self.pairs = {}
+
+    def add(self, result):
+        """Враховує результати однієї пачки гра за грою (Ело залежить від порядку)."""
+        a, b = result["a"], result["b"]
+        for outcome in result["outcomes"]:
+            score_a = {"1": 1.0, "2": 0.0, "0": 0.5}[outcome]
+            expected_a = 1 / (1 + 10 ** ((self.elo[b] - self.elo[a]) / 400))
+            self.elo[a] += ELO_K * (score_a - expected_a)
+            self.elo[b] -= ELO_K * (score_a - expected_a)
+        wins_a = result["outcomes"].count("1")
+        wins_b = result["outcomes"].count("2")
+        draws = result["games"] - wins_a - wins_b
+        self.wins[a] += wins_a
+        self.wins[b] += wins_b
+        self.draws[a] += draws
+        self.draws[b] += draws
+        self.games[a] += result["games"]
+        self.games[b] += result["games"]
+        pair = self.pairs.setdefault(tuple(sorted((a, b))), [0, 0, 0])
+        pair[0] += wins_a if a < b else wins_b
+        pair[1] += wins_b if a < b else wins_a
+        pair[2] += draws
+
+    def table(self):
+        lines = [f"{'Стратегія':<14}{'Ело':>8}{'Ігор':>10}{'Перемог':>10}{'Нічиїх':>10}"]
+        for name in sorted(self.elo, key=self.elo.get, reverse=True):
+            games = self.games[name] or 1
+            lines.append(f"{name:<14}{self.elo[name]:>8.1f}{self.games[name]:>10}"
+                         f"{self.wins[name] / games:>10.1%}{self.draws[name] / games:>10.1%}")
+        return "\n".join(lines)
+
+
+def load_results(path):
+    """Читає вже зіграні пачки з файлу результатів (JSON Lines).
+
+    Зіпсовані рядки пропускаються, а обірваний останній рядок після
+    аварійної зупинки обрізається, щоб нові результати дописувались
+    з початку рядка.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb+") as file:
+        data = file.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            file.truncate(end)
+    results = []
+    for line in data[:end].decode("utf-8", errors="replace").splitlines():
+        try:
+            result = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(result, dict) and all(key in result for key in RESULT_KEY):
+            results.append(result)
+    return results
+
+
+def make_tasks(names, rounds, games, max_score, max_ticks):
+    """Коловий турнір: кожна впорядкована пара грає rounds пачок на однакових сідах."""
+    for round_index in range(rounds):
+        for a, b in itertools.permutations(names, 2):
+            yield {"a": a, "b": b, "specs": (STRATEGIES[a], STRATEGIES[b]),
+                   "seed": round_index * games, "games": games,
+                   "max_score": max_score, "max_ticks": max_ticks}
+
+
+def run_tournament(names, rounds=10, games=1000, max_score=3, max_ticks=20000,
+                   results_path="tournament_results.jsonl", workers=None, report_every=10.0):
+    """Грає турнір на всіх ядрах, дописуючи кожну пачку в results_path.
+
+    Перезапуск з тим самим файлом продовжує турнір: зіграні пачки
+    пропускаються, а їхні результати одразу враховуються в таблиці.
+    """
+    standings = Standings(names)
+    planned = {result_key(task) for task in make_tasks(names, rounds, games, max_score, max_ticks)}
+    done = set()
+    for result in load_results(results_path):
+        # Враховуються лише пачки цього турніру (ті самі стратегії й параметри)
+        key = result_key(result)
+        if key in planned and key not in done:
+            standings.add(result)
+            done.add(key)
+    tasks = (task for task in make_tasks(names, rounds, games, max_score, max_ticks)
+             if result_key(task) not in done)
+
+    workers = workers or os.cpu_count()
+    started = last_report = time.perf_counter()
+    played = 0
+    with ProcessPoolExecutor(workers) as pool, \
+            open(results_path, "a", encoding="utf-8") as out:
+        # Тримаємо в роботі по дві пачки на процес, решту подаємо по мірі готовності
+        pending = {pool.submit(play_task, task) for task in itertools.islice(tasks, 2 * workers)}
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                out.write(json.dumps(result) + "\n")
+                standings.add(result)
+                played += result["games"]
+            out.flush()
+            pending |= {pool.submit(play_task, task)
+                        for task in itertools.islice(tasks, len(finished))}
+
+            now = time.perf_counter()
+            if now - last_report >= report_every:
+                last_report = now
+                print(f"{played} ігор, {played / (now - started):,.0f} ігор/с")
+                print(standings.table())
+    elapsed = time.perf_counter() - started
+    print(f"Зіграно {played} нових ігор за {elapsed:.1f} с на {workers} процесах")
+    print(standings.table())
+    return standings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ping-pong round-robin tournament")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES),
+                        choices=list(STRATEGIES))
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--games", type=int, default=1000, help="ігор в одній пачці")
+    parser.add_argument("--max-score", type=int, default=3)
+    parser.add_argument("--max-ticks", type=int, default=20000)
+    parser.add_argument("--results", default="tournament_results.jsonl")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    run_tournament(args.strategies, args.rounds, args.games, args.max_score, args.max_ticks,
+                   args.results, args.workers)
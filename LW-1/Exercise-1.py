@@ -1,23 +1,134 @@
-a = int(input("Enter the value of a (from 1 to 100): "))
-b = int(input("Enter the value of b (from 1 to 100): "))
-
-# Checking if the entered values are correct
-if not (1 <= a <= 100) or not (1 <= b <= 100):
-    print("Values of a and b must be in the range from 1 to 100.")
-    X = None # To avoid errors if X is not defined
-else:
+import argparse
+import itertools
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the batch mode
+    np = None
+
+# Condition codes written next to X in the batch mode
+INVALID, LESS, EQUAL, GREATER = range(4)
+CONDITIONS = ("out of range", "a < b", "a = b", "a > b")
+
+def calculate_x(a, b):
+    """Calculate X for one pair; returns (X, condition) or (None, None) if out of range."""
+    # Checking if the entered values are correct
+    if not (1 <= a <= 100) or not (1 <= b <= 100):
+        return None, None
     # Calculating the value of X
     if a < b:
-        X = (a * 3 - 5) / b
-        condition = "a < b"
+        return (a * 3 - 5) / b, CONDITIONS[LESS]
     elif a == b:
-        X = -4
-        condition = "a = b"
+        return -4, CONDITIONS[EQUAL]
+    else:
+        return (a**4 + b) / a, CONDITIONS[GREATER]
+
+def calculate_x_array(a, b):
+    """Calculate X for whole arrays of a and b at once.
+
+    Returns X as float64 (NaN where a or b is outside 1..100) and the
+    condition code of each row (INVALID, LESS, EQUAL or GREATER).
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    valid = (a >= 1) & (a <= 100) & (b >= 1) & (b <= 100)
+    code = np.select([~valid, a < b, a == b], [INVALID, LESS, EQUAL], GREATER).astype(np.int8)
+    # Both formulas are evaluated for every row; the invalid ones are masked out below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.select([code == LESS, code == EQUAL, code == GREATER],
+                      [(a * 3 - 5) / b, -4.0, (a**4 + b) / a], np.nan)
+    return x, code
+
+def result_table():
+    """Formatted "X,condition" line for every valid pair, indexed by (a - 1) * 100 + b.
+
+    Index 0 holds the line for out-of-range pairs. With integers from 1 to 100
+    there are only 10 000 distinct results, so the batch mode formats them once
+    and then only looks lines up instead of formatting every row.
+    """
+    a, b = np.divmod(np.arange(100 * 100), 100)
+    x, code = calculate_x_array(a + 1, b + 1)
+    lines = [f"{value},{CONDITIONS[c]}" for value, c in zip(x.tolist(), code.tolist())]
+    return np.array([f"nan,{CONDITIONS[INVALID]}"] + lines, dtype=object)
+
+def parse_pairs(lines):
+    """Turn CSV lines "a,b" into two int64 arrays.
+
+    Only integers are accepted, as in the interactive mode; any other row
+    raises ValueError naming it. Integers beyond int64 are outside 1..100
+    anyway, so they are stored as 0 and reported as out of range.
+    """
+    try:
+        pairs = np.loadtxt(lines, delimiter=",", dtype=np.int64, ndmin=2)
+        if pairs.shape[1] != 2:
+            raise ValueError("not a pair per row")
+    except (ValueError, OverflowError):
+        rows = []
+        for line in lines:
+            try:
+                a, b = (int(value) for value in line.split(","))
+            except ValueError:
+                raise ValueError(f"expected a pair of integers a,b, got {line.strip()!r}") from None
+            rows.append([a if 1 <= a <= 100 else 0, b if 1 <= b <= 100 else 0])
+        pairs = np.array(rows, dtype=np.int64, ndmin=2)
+    return pairs[:, 0], pairs[:, 1]
+
+def run_batch(source, target, chunk_size=1_000_000):
+    """Read integer a,b pairs from source in chunks and write "X,condition" lines to target."""
+    table = result_table()
+    lines = iter(source)
+    first = next(lines, None)
+    if first is None:
+        return
+    # A header line such as "a,b" is skipped
+    if first.strip() and first.lstrip()[0] not in "+-0123456789":
+        first = None
+    lines = itertools.chain([first] if first else [], lines)
+    while True:
+        chunk = [line for line in itertools.islice(lines, chunk_size) if line.strip()]
+        if not chunk:
+            break
+        a, b = parse_pairs(chunk)
+        # The 1..100 range check as a mask: rows outside it point to line 0
+        valid = (a >= 1) & (a <= 100) & (b >= 1) & (b <= 100)
+        index = np.where(valid, (a - 1) * 100 + b, 0)
+        target.write("\n".join(table[index].tolist()))
+        target.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculate X(a, b)")
+    parser.add_argument("--batch", metavar="FILE", nargs="?", const="-",
+                        help="read integer a,b pairs from a CSV file (or - for stdin)")
+    parser.add_argument("--output", metavar="FILE", help="write the results here instead of stdout")
+    parser.add_argument("--chunk", type=int, default=1_000_000, help="rows per chunk")
+    args = parser.parse_args()
+
+    if args.batch:
+        source = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+        target = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            run_batch(source, target, args.chunk)
+        except ValueError as error:
+            sys.exit(f"{parser.prog}: error: {error}")
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if target is not sys.stdout:
+                target.close()
+        return
+
+    a = int(input("Enter the value of a (from 1 to 100): "))
+    b = int(input("Enter the value of b (from 1 to 100): "))
+
+    X, condition = calculate_x(a, b)
+
+    # Outputting the result
+    if X is None:
+        print("Values of a and b must be in the range from 1 to 100.")
     else:
-        X = (a**4 + b) / a
-        condition = "a > b"
+        print("The value of X: ", X)
+        print("Condition used:", condition)
 
-# Outputting the result
-if X is not None:
-    print("The value of X: ", X) 
-    print("Condition used:", condition)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
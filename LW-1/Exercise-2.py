@@ -1,11 +1,243 @@
-# List of numbers 
+import argparse
+import itertools
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy only the built-in list is tabulated
+    np = None
+
+# List of numbers used when no range or file is given
 numbers = [1,3,5,9,17]
 
-# Print the header of the table 
-print(f"{'Number': <10} {'Square': <10} {'Cube': <10}")
+# Width of a column in the text table
+COLUMN_WIDTH = 10
+
+# The largest number whose cube still fits into int64
+MAX_INT64_CUBE_BASE = 2097151
+
+# Text output works with base 10**6 "limbs", so cubes of numbers below
+# MAX_LIMB_BASE are formatted exactly without Python ints
+LIMB_DIGITS = 6
+LIMB = 10 ** LIMB_DIGITS
+MAX_LIMB_BASE = 10 ** 12
+
+def number_chunks(values, chunk_size=1_000_000):
+    """Split any sequence of numbers into NumPy arrays of at most chunk_size."""
+    values = iter(values)
+    while True:
+        chunk = list(itertools.islice(values, chunk_size))
+        if not chunk:
+            break
+        yield np.array(chunk)
+
+def range_chunks(start, stop, step=1, chunk_size=1_000_000):
+    """Numbers of range(start, stop, step) as int64 arrays, chunk by chunk."""
+    for low in range(start, stop, step * chunk_size):
+        high = low + step * chunk_size
+        high = min(high, stop) if step > 0 else max(high, stop)
+        yield np.arange(low, high, step, dtype=np.int64)
+
+def parse_number(text):
+    """A Python int if the text is an integer, otherwise a float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def file_chunks(file, chunk_size=1_000_000):
+    """Numbers from a text file with one number per line, chunk by chunk.
+
+    A chunk of int64 values is parsed at once. Otherwise every line is
+    parsed on its own: integers stay exact Python ints (an object array,
+    even beyond int64) and only the lines written as floats are floats.
+    """
+    lines = iter(file)
+    while True:
+        chunk = [line for line in itertools.islice(lines, chunk_size) if line.strip()]
+        if not chunk:
+            break
+        try:
+            yield np.loadtxt(chunk, dtype=np.int64, ndmin=1)
+        except (ValueError, OverflowError):
+            values = [parse_number(line) for line in chunk]
+            floats = not any(isinstance(value, int) for value in values)
+            yield np.array(values, dtype=np.float64 if floats else object)
+
+def power_table(chunks):
+    """Generator of (number, square, cube) arrays for every chunk of numbers.
+
+    Integers stay int64 while the cube fits into it; larger ones are
+    calculated with Python ints (object arrays), floats stay float64.
+    """
+    for num in chunks:
+        if num.dtype.kind in "iu" and num.size and np.abs(num).max() > MAX_INT64_CUBE_BASE:
+            num = num.astype(object)
+        square = num ** 2
+        cube = square * num
+        yield num, square, cube
+
+def _to_limbs(values):
+    """Split non-negative int64 values into base-LIMB digits, least significant first."""
+    limbs = []
+    while True:
+        values, limb = np.divmod(values, LIMB)
+        limbs.append(limb)
+        if not values.any():
+            return limbs
+
+def _multiply_limbs(x, y):
+    """Product of two numbers given as limbs (schoolbook multiplication with carries)."""
+    product = [0] * (len(x) + len(y))
+    for i, a in enumerate(x):
+        for j, b in enumerate(y):
+            product[i + j] = product[i + j] + a * b
+    carry = 0
+    for k, value in enumerate(product):
+        carry, product[k] = np.divmod(value + carry, LIMB)
+    while len(product) > 1 and not product[-1].any():
+        product.pop()
+    return product
+
+def format_int_rows(columns, width=COLUMN_WIDTH, separator=" "):
+    """Format integer columns into text rows as bytes without a Python call per row.
+
+    Every column is a pair (negative, limbs) and the result equals
+    "".join(f"{a: <width}{separator}{b: <width}...\\n"). A column is laid out
+    as a sign cell, right-aligned digits, padding cells and a separator; a
+    mask keeps the sign only for negatives, drops the leading zeros and keeps
+    just enough padding, and one compaction produces the text. The cells are
+    filled position by position (one contiguous line per character position)
+    and transposed into rows at the end.
+    """
+    rows = len(columns[0][0])
+    digits = [LIMB_DIGITS * (len(limbs) - 1) + len(str(int(limbs[-1].max()))) if rows else 1
+              for _, limbs in columns]
+    total = sum(digits) + len(columns) * (width + 2)
+    cells = np.full((total, rows), ord(" "), dtype=np.uint8)
+    keep = np.zeros((total, rows), dtype=bool)
+
+    start = 0
+    for (negative, limbs), count in zip(columns, digits):
+        # Number of digits of every value: positions below the highest non-zero one
+        above = [False] * len(limbs)
+        for i in range(len(limbs) - 2, -1, -1):
+            above[i] = above[i + 1] | (limbs[i + 1] != 0)
+        length = np.ones(rows, dtype=np.int64)
+        for k in range(1, count):
+            i, power = divmod(k, LIMB_DIGITS)
+            length += above[i] | (limbs[i] >= 10 ** power)
+
+        cells[start, negative] = ord("-")
+        keep[start] = negative
+        start += 1
+        for k in range(count):
+            i, power = divmod(k, LIMB_DIGITS)
+            if power == 0:
+                rest = limbs[i]
+            rest, cells[start + count - 1 - k] = np.divmod(rest, 10)
+        cells[start:start + count] += ord("0")
+        keep[start:start + count] = np.arange(count)[:, None] >= count - length
+        start += count
+        keep[start:start + width] = np.arange(width)[:, None] < width - length - negative
+        start += width
+        cells[start] = ord(separator)
+        keep[start] = True
+        start += 1
+    cells[-1] = ord("\n")
+    return cells.T[keep.T].tobytes()
+
+def format_powers(num, mode):
+    """Text of the table rows for one chunk of numbers as bytes: "table" or "csv" mode."""
+    width, separator = (COLUMN_WIDTH, " ") if mode == "table" else (0, ",")
+    if num.dtype.kind in "iu" and (not num.size or np.abs(num).max() < MAX_LIMB_BASE):
+        # Squares and cubes in limbs, so they never overflow int64
+        negative = num < 0
+        limbs = _to_limbs(np.abs(num).astype(np.int64))
+        square = _multiply_limbs(limbs, limbs)
+        cube = _multiply_limbs(square, limbs)
+        return format_int_rows(((negative, limbs), (np.zeros_like(negative), square),
+                                (negative, cube)), width, separator)
+    # Floats and huge integers: still one join per chunk instead of a print per row
+    num, square, cube = next(power_table([num]))
+    return format_rows(num.tolist(), square.tolist(), cube.tolist(), mode)
+
+def format_rows(num, square, cube, mode):
+    """Text of the table rows for lists of Python numbers as bytes."""
+    width, separator = (COLUMN_WIDTH, " ") if mode == "table" else (0, ",")
+    row = f"{{: <{width}}}{separator}{{: <{width}}}{separator}{{: <{width}}}"
+    return ("\n".join(map(row.format, num, square, cube)) + "\n").encode()
+
+def table_header(mode):
+    if mode == "table":
+        return f"{'Number': <10} {'Square': <10} {'Cube': <10}\n".encode()
+    return b"number,square,cube\n"
+
+def write_table(chunks, target, mode="table"):
+    """Write the table for all chunks of numbers into a binary stream.
+
+    "table" - fixed-width columns as in the original printout, "csv" - comma
+    separated values, "binary" - raw little-endian triples (int64 or float64).
+    """
+    if mode == "binary":
+        for num, square, cube in power_table(chunks):
+            if num.dtype == object:
+                raise OverflowError("the binary format needs int64 cubes (numbers up to "
+                                    f"{MAX_INT64_CUBE_BASE}) or a chunk of floats only")
+            triples = np.column_stack((num, square, cube))
+            target.write(triples.astype(num.dtype.newbyteorder("<")).tobytes())
+        return
+    # Print the header of the table
+    target.write(table_header(mode))
+    for num in chunks:
+        # One large write() per chunk
+        target.write(format_powers(num, mode))
+
+def main():
+    parser = argparse.ArgumentParser(description="Table of squares and cubes")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--range", nargs="+", type=int, metavar="N",
+                        help="START STOP [STEP] as for range()")
+    source.add_argument("--file", help="text file with one number per line (- for stdin)")
+    parser.add_argument("--format", choices=("table", "csv", "binary"), default="table")
+    parser.add_argument("--output", help="write the table here instead of stdout")
+    parser.add_argument("--chunk", type=int, default=1_000_000, help="numbers per chunk")
+    args = parser.parse_args()
+
+    if np is None:
+        if args.range or args.file or args.format == "binary":
+            parser.error("--range, --file and --format binary need NumPy")
+        # The original table of the built-in list, in plain Python
+        squares = [num ** 2 for num in numbers]
+        cubes = [square * num for square, num in zip(squares, numbers)]
+        target = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            target.write(table_header(args.format) + format_rows(numbers, squares, cubes,
+                                                                 args.format))
+        finally:
+            if target is not sys.stdout.buffer:
+                target.close()
+        return
+
+    file = None
+    if args.range:
+        if not 2 <= len(args.range) <= 3:
+            parser.error("--range takes START STOP [STEP]")
+        chunks = range_chunks(*args.range, chunk_size=args.chunk)
+    elif args.file:
+        file = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8")
+        chunks = file_chunks(file, args.chunk)
+    else:
+        chunks = number_chunks(numbers, args.chunk)
+
+    target = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        write_table(chunks, target, args.format)
+    finally:
+        if file is not None and file is not sys.stdin:
+            file.close()
+        if target is not sys.stdout.buffer:
+            target.close()
 
-# Calculate squares and cubes, and output the results for num in numbers:
-for num in numbers:
-    square = num ** 2
-    cube = num ** 3
-    print(f"{num: <10} {square: <10} {cube: <10}")
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,133 @@
+import argparse
+import itertools
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the batch mode
+    np = None
+
+from factorial_module import factorial
+
 def calculate_z(x, y):
     """Calculate the value of z based on the value of x and y."""
     if x > 8:
         z = 3 + y
     else:
-        z = 9 * x * y 
+        z = 9 * x * y
+    return z
+
+def calculate_z_array(x, y):
+    """Calculate z for whole arrays of x and y at once.
+
+    Float inputs are evaluated directly. For integer inputs the rows whose
+    result would not fit into int64 are recalculated with Python ints, and
+    then the result is an object array; otherwise it stays int64.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    z = np.where(x > 8, 3 + y, 9 * x * y)
+    if not (np.issubdtype(x.dtype, np.integer) and np.issubdtype(y.dtype, np.integer)):
+        return z
+
+    # Overflow check in float64 with a safety margin, so no row is missed by rounding
+    xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+    risky = np.where(x > 8, np.abs(yf) + 3 >= 2 ** 62, 9 * np.abs(xf) * np.abs(yf) >= 2 ** 62)
+    if risky.any():
+        z = z.astype(object)
+        for i in np.flatnonzero(risky):
+            z[i] = calculate_z(int(x[i]), int(y[i]))
     return z
 
-def factorial(n):
-    """Calculate the factorial of n using a loop."""
-    result = 1
-    for i in range(2, n + 1): 
-        result *= i
-    return result
+def parse_number(text):
+    """A Python int if the text is an integer, otherwise a float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def parse_chunk(lines):
+    """Turn CSV lines "x,y" into two arrays.
+
+    A chunk of int64 values is parsed at once. Otherwise every value is
+    parsed on its own, so integers stay exact Python ints (even beyond
+    int64) and only the values written as floats are floats: the result of
+    a row does not depend on the other rows of its chunk.
+    """
+    try:
+        pairs = np.loadtxt(lines, delimiter=",", dtype=np.int64, ndmin=2)
+        if pairs.shape[1] != 2:
+            raise ValueError("not a pair per row")
+    except (ValueError, OverflowError):
+        rows = []
+        for line in lines:
+            try:
+                x, y = (parse_number(value) for value in line.split(","))
+            except ValueError:
+                raise ValueError(f"expected a pair of numbers x,y, got {line.strip()!r}") from None
+            rows.append([x, y])
+        if any(isinstance(value, int) for row in rows for value in row):
+            pairs = np.array(rows, dtype=object, ndmin=2)
+        else:
+            pairs = np.array(rows, dtype=np.float64, ndmin=2)
+    return pairs[:, 0], pairs[:, 1]
+
+def run_batch(source, target, chunk_size=1_000_000):
+    """Read x,y pairs from source in chunks and write one z per line to target."""
+    lines = iter(source)
+    first = next(lines, None)
+    if first is None:
+        return
+    # A header line such as "x,y" is skipped
+    if first.strip() and first.lstrip()[0] not in "+-0123456789.":
+        first = None
+    lines = itertools.chain([first] if first else [], lines)
+    while True:
+        chunk = [line for line in itertools.islice(lines, chunk_size) if line.strip()]
+        if not chunk:
+            break
+        x, y = parse_chunk(chunk)
+        z = calculate_z_array(x, y)
+        target.write("\n".join(map(str, z.tolist())))
+        target.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculate z(x, y) and n!")
+    parser.add_argument("--batch", metavar="FILE", nargs="?", const="-",
+                        help="read x,y pairs from a CSV file (or - for stdin)")
+    parser.add_argument("--output", metavar="FILE", help="write the results here instead of stdout")
+    parser.add_argument("--chunk", type=int, default=1_000_000, help="rows per chunk")
+    args = parser.parse_args()
+
+    if args.batch:
+        source = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+        target = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            run_batch(source, target, args.chunk)
+        except ValueError as error:
+            sys.exit(f"{parser.prog}: error: {error}")
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if target is not sys.stdout:
+                target.close()
+        return
+
+    # Input for x and y
+    x = int(input("Enter the value of x: "))
+    y = int(input("Enter the value of y: "))
 
-# Input for x and y
-x = int(input("Enter the value of x: "))
-y = int(input("Enter the value of y: "))
+    # Calculate and display z
+    z = calculate_z(x, y)
+    print(f"The value of z is: {z}")
 
-# Calculate and display z
-z = calculate_z(x, y)
-print(f"The value of z is: {z}")
+    # Input for n
+    n = int(input("Enter the value of n: "))
 
-# Input for n
-n = int(input("Enter the value of n: "))
+    # Calculate and display factorial of n
+    factorial_of_n = factorial(n)
+    print(f"The factorial of {n} is: {factorial_of_n}")
 
-# Calculate and display factorial of n
-factorial_of_n = factorial(n)
-print(f"The factorial of {n} is: {factorial_of_n}")
+if __name__ == "__main__":
+    main()
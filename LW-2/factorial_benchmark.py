@@ -0,0 +1,51 @@
+import sys
+import time
+
+from factorial_module import factorial, parallel_factorial, calibrate_parallel_threshold
+
+
+def loop_factorial(n):
+    """The original loop version, kept as the reference for the benchmark."""
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def measure(function, n):
+    """Return the time in seconds of one call of function(n) and its result."""
+    start = time.perf_counter()
+    result = function(n)
+    return time.perf_counter() - start, result
+
+
+def main():
+    # The loop version takes minutes at n = 10**6, so it is skipped above this limit
+    loop_limit = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    sizes = [10 ** 3, 10 ** 4, 10 ** 5, 3 * 10 ** 5, 10 ** 6]
+
+    print(f"{'n': >10} {'loop, s': >10} {'split, s': >10} {'speedup': >10}")
+    for n in sizes:
+        split_time, split_result = measure(factorial, n)
+        if n <= loop_limit:
+            loop_time, loop_result = measure(loop_factorial, n)
+            if loop_result != split_result:
+                print(f"Results differ for n = {n}!")
+                return
+            print(f"{n: >10} {loop_time: >10.4f} {split_time: >10.4f} {loop_time / split_time: >9.1f}x")
+        else:
+            print(f"{n: >10} {'skipped': >10} {split_time: >10.4f} {'-': >10}")
+
+    # Multi-process version for the largest n
+    threshold = calibrate_parallel_threshold()
+    print(f"\nParallel threshold: n >= {threshold}")
+    n = sizes[-1]
+    parallel_time, parallel_result = measure(parallel_factorial, n)
+    if parallel_result != factorial(n):
+        print(f"Parallel result differs for n = {n}!")
+        return
+    print(f"parallel_factorial({n}): {parallel_time:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
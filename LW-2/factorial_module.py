@@ -1,6 +1,329 @@
+import bisect
+import math
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _odd_product(low, high):
+    """Product of the odd numbers in [low, high), multiplied as a balanced tree."""
+    count = (high - low) // 2
+    if count <= 0:
+        return 1
+    if count <= 16:
+        result = low
+        for i in range(low + 2, high, 2):
+            result *= i
+        return result
+    # Split in the middle so that both halves have operands of similar size
+    middle = (low + count) | 1
+    return _odd_product(low, middle) * _odd_product(middle, high)
+
+
 def factorial(n):
-    """Calculate the factorial of n using a loop."""
+    """Calculate the factorial of n using binary splitting.
+
+    n! is split into a power of two and an odd part. The odd part is
+    built from products of odd numbers over the ranges (n >> (i + 1), n >> i],
+    each computed as a product tree, so big numbers are only ever
+    multiplied by numbers of similar size.
+    """
+    if n < 2:
+        return 1
+    inner = outer = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        inner *= _odd_product(((n >> (i + 1)) + 1) | 1, ((n >> i) + 1) | 1)
+        outer *= inner
+    return outer << (n - bin(n).count("1"))
+
+
+def _range_product(low, high):
+    """Product of the integers in [low, high), multiplied as a balanced tree."""
+    if high - low <= 16:
+        result = 1
+        for i in range(low, high):
+            result *= i
+        return result
+    middle = (low + high) // 2
+    return _range_product(low, middle) * _range_product(middle, high)
+
+
+class FactorialCache:
+    """Factorials extended from stored checkpoints instead of from 1.
+
+    Every step-th factorial that gets computed is kept as a checkpoint,
+    as long as the checkpoints fit into memory_limit bytes; the least
+    recently used ones are dropped first. A query for n multiplies the
+    nearest checkpoint below n by the remaining range.
+    """
+
+    def __init__(self, step=1000, memory_limit=64 * 1024 * 1024):
+        self.step = step
+        self.memory_limit = memory_limit
+        self._checkpoints = OrderedDict()  # n -> n!, least recently used first
+        self._keys = []                    # the same n, sorted for bisect
+        self.memory = 0
+        self.hits = 0          # n was a checkpoint
+        self.partial_hits = 0  # extended from a checkpoint or a previous query
+        self.misses = 0        # computed from scratch
+
+    def _nearest(self, n):
+        """The largest checkpoint not greater than n, as (k, k!), or (0, 1)."""
+        index = bisect.bisect_right(self._keys, n)
+        if index == 0:
+            return 0, 1
+        k = self._keys[index - 1]
+        self._checkpoints.move_to_end(k)
+        return k, self._checkpoints[k]
+
+    def _remember(self, k, value):
+        if k in self._checkpoints:
+            return
+        size = sys.getsizeof(value)
+        if size > self.memory_limit:
+            return
+        while self.memory + size > self.memory_limit:
+            old_k, old_value = self._checkpoints.popitem(last=False)
+            self._keys.remove(old_k)
+            self.memory -= sys.getsizeof(old_value)
+        self._checkpoints[k] = value
+        bisect.insort(self._keys, k)
+        self.memory += size
+
+    def _extend(self, k, value, n):
+        """n! from k! = value, saving the last checkpoint passed on the way."""
+        checkpoint = n // self.step * self.step
+        if checkpoint > k:
+            value *= _range_product(k + 1, checkpoint + 1)
+            self._remember(checkpoint, value)
+            k = checkpoint
+        return value * _range_product(k + 1, n + 1)
+
+    def get(self, n):
+        """Return n!, using and filling the checkpoint table."""
+        if n < 2:
+            return 1
+        k, value = self._nearest(n)
+        if k == n:
+            self.hits += 1
+            return value
+        if k * 2 < n:
+            # A far checkpoint does not help: binary splitting from 1 is faster
+            self.misses += 1
+            checkpoint = n - n % self.step
+            if checkpoint < 2:
+                return factorial(n)
+            value = factorial(checkpoint)
+            self._remember(checkpoint, value)
+            return value * _range_product(checkpoint + 1, n + 1)
+        self.partial_hits += 1
+        return self._extend(k, value, n)
+
+    def many(self, ns):
+        """Return the factorials of all ns in one increasing sweep.
+
+        Queries are sorted, so each one only multiplies the previous
+        result by the gap between them. Results keep the order of ns.
+        """
+        results = {}
+        previous_n = previous = None
+        for n in sorted(set(ns)):
+            if previous is None or previous_n * 2 < n:
+                value = self.get(n)
+            else:
+                self.partial_hits += 1
+                value = self._extend(previous_n, previous, n)
+            results[n] = value
+            previous_n, previous = n, value
+        return [results[n] for n in ns]
+
+    def stats(self):
+        """Hit rate and memory usage of the cache."""
+        queries = self.hits + self.partial_hits + self.misses
+        return {
+            "queries": queries,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.partial_hits) / queries if queries else 0.0,
+            "checkpoints": len(self._checkpoints),
+            "memory_bytes": self.memory,
+            "memory_limit": self.memory_limit,
+        }
+
+
+# Shared cache behind the module-level helpers
+_cache = FactorialCache()
+
+
+def cached_factorial(n):
+    """Calculate the factorial of n, reusing checkpoints from earlier calls."""
+    return _cache.get(n)
+
+
+def factorial_many(ns):
+    """Calculate the factorials of all ns in one increasing sweep."""
+    return _cache.many(ns)
+
+
+def cache_stats():
+    """Statistics of the shared factorial cache."""
+    return _cache.stats()
+
+
+# Below this n the parallel factorial stays in one process; None until calibrated
+PARALLEL_THRESHOLD = None
+
+
+def _balanced_ranges(low, high, parts):
+    """Split [low, high) into ranges whose products have about the same size.
+
+    The bit length of the product of [2, x) grows like x*ln(x) - x, so the
+    boundaries are placed at equal steps of that function (found by bisection).
+    """
+    def size(x):
+        return x * math.log(x) - x
+
+    total_low, total_high = size(low), size(high)
+    bounds = [low]
+    for k in range(1, parts):
+        target = total_low + (total_high - total_low) * k / parts
+        left, right = bounds[-1], high
+        while right - left > 1:
+            middle = (left + right) // 2
+            if size(middle) < target:
+                left = middle
+            else:
+                right = middle
+        bounds.append(right)
+    bounds.append(high)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def _range_product_task(bounds):
+    return _range_product(*bounds)
+
+
+def _product_tree(values):
+    """Multiply a list of numbers pairwise, like the levels of a tree."""
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0] if values else 1
+
+
+def parallel_factorial(n, workers=None, threshold=None):
+    """Calculate the factorial of n, splitting the work between processes.
+
+    range(2, n + 1) is cut into sub-ranges with products of similar size,
+    each sub-range is multiplied in a worker process, and the partial
+    products are combined with a product tree. For n below the threshold
+    (by default found once by calibrate_parallel_threshold()) the
+    pickling overhead is not worth it and factorial(n) is used instead.
+    """
+    workers = workers or os.cpu_count() or 1
+    if threshold is None:
+        threshold = PARALLEL_THRESHOLD
+        if threshold is None:
+            threshold = calibrate_parallel_threshold(workers)
+    if n < threshold or workers < 2:
+        return factorial(n)
+    ranges = _balanced_ranges(2, n + 1, workers * 4)
+    with ProcessPoolExecutor(workers) as pool:
+        parts = list(pool.map(_range_product_task, ranges))
+    return _product_tree(parts)
+
+
+def calibrate_parallel_threshold(workers=None, max_n=2 ** 21):
+    """Find the smallest n (a power of two) at which parallel_factorial wins.
+
+    The result is stored in PARALLEL_THRESHOLD and returned. On a single
+    core the threshold is infinity and no benchmark is run.
+    """
+    global PARALLEL_THRESHOLD
+    workers = workers or os.cpu_count() or 1
+    PARALLEL_THRESHOLD = math.inf
+    if workers < 2:
+        return PARALLEL_THRESHOLD
+    n = 2 ** 14
+    while n <= max_n:
+        start = time.perf_counter()
+        factorial(n)
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        parallel_factorial(n, workers, threshold=0)
+        parallel = time.perf_counter() - start
+        if parallel < single:
+            PARALLEL_THRESHOLD = n
+            break
+        n *= 2
+    return PARALLEL_THRESHOLD
+
+
+def log_factorial(n):
+    """Natural logarithm of n!, without computing n! itself."""
+    if n < 2:
+        return 0.0
+    return math.lgamma(n + 1)
+
+
+def factorial_digits(n):
+    """Number of decimal digits of n!.
+
+    Taken from log10(n!) = lgamma(n + 1) / ln(10). If the logarithm is
+    too close to an integer for a float to decide, the exact factorial
+    settles it.
+    """
+    if n < 2:
+        return 1
+    log10 = log_factorial(n) / math.log(10)
+    digits = math.floor(log10) + 1
+    # The error of lgamma grows with the magnitude of the logarithm
+    tolerance = abs(log10) * 1e-14 + 1e-12
+    if log10 - math.floor(log10) < tolerance or math.ceil(log10) - log10 < tolerance:
+        # Borderline case: n! >= 10 ** (digits - 1) decides
+        exact = factorial(n)
+        digits = math.floor(log10)
+        while exact >= 10 ** digits:
+            digits += 1
+        while digits > 1 and exact < 10 ** (digits - 1):
+            digits -= 1
+    return digits
+
+
+def legendre(n, p):
+    """Exponent of the prime p in n! (Legendre's formula)."""
+    exponent = 0
+    while n >= p:
+        n //= p
+        exponent += n
+    return exponent
+
+
+def trailing_zeros(n):
+    """Number of trailing zeros of n!: the number of factors 5 in n!."""
+    return legendre(n, 5)
+
+
+def factorial_mod(n, m, chunk=32):
+    """Calculate n! mod m without building n!.
+
+    Numbers are multiplied in chunks with math.prod and the result is
+    reduced modulo m after every chunk, so memory stays constant.
+    """
+    if m < 0:
+        raise ValueError("factorial_mod() modulus must be positive")
+    if m == 0:
+        raise ZeroDivisionError("factorial_mod() modulus is zero")
+    if m == 1:
+        return 0
+    if n >= m:
+        return 0  # m itself is one of the factors
     result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
\ No newline at end of file
+    for start in range(2, n + 1, chunk):
+        result = result * math.prod(range(start, min(start + chunk, n + 1))) % m
+    return result
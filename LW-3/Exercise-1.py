@@ -1,8 +1,98 @@
-# Assign a string to the variable
-my_string = input("Enter your string: ")
+import argparse
+import mmap
+import os
+import sys
 
-# Get every third letter 
-third_letter_slice = my_string[::3]
+# Characters (or bytes) of a file processed at once
+CHUNK_SIZE = 1 << 22
 
-# Print the result
-print("Every third letter:", third_letter_slice)
\ No newline at end of file
+def first_index(position, stride, start=0):
+    """Index of the first taken element in a chunk that begins at position.
+
+    Taken are the elements start, start + stride, ... of the whole stream,
+    so the phase is carried from chunk to chunk whatever their sizes.
+    """
+    if start >= position:
+        return start - position
+    return (start - position) % stride
+
+def strided(chunks, stride, start=0):
+    """Generator of chunk[first::stride] over a stream of str or bytes chunks.
+
+    The result joined together equals the whole stream sliced [start::stride].
+    """
+    position = 0
+    for chunk in chunks:
+        yield chunk[first_index(position, stride, start)::stride]
+        position += len(chunk)
+
+def strided_mapped(path, stride, start=0, chunk_size=CHUNK_SIZE):
+    """Like strided() for a file of bytes, but sliced straight from a memory map.
+
+    Only the taken bytes are copied, a chunk at a time, so the file is never
+    read into memory as a whole.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for position in range(0, size, chunk_size):
+            first = position + first_index(position, stride, start)
+            yield data[first:position + chunk_size:stride]
+
+def read_chunks(file, chunk_size=CHUNK_SIZE):
+    """Read a file (text or binary) piece by piece."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+def main():
+    parser = argparse.ArgumentParser(description="Take every N-th character")
+    parser.add_argument("file", nargs="?", help="file to slice (- for stdin)")
+    parser.add_argument("--stride", type=int, default=3)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--bytes", action="store_true",
+                        help="slice bytes instead of UTF-8 characters (for ASCII and binary files)")
+    parser.add_argument("--output", help="write the result here instead of stdout")
+    args = parser.parse_args()
+    if args.stride < 1 or args.start < 0:
+        parser.error("--stride must be positive and --start not negative")
+
+    if args.file is None:
+        # Assign a string to the variable
+        my_string = input("Enter your string: ")
+
+        # Get every third letter
+        third_letter_slice = my_string[args.start::args.stride]
+
+        # Print the result
+        print("Every third letter:", third_letter_slice)
+        return
+
+    source = None  # The text file opened here, closed with the output
+    if args.bytes:
+        if args.file == "-":
+            pieces = strided(read_chunks(sys.stdin.buffer), args.stride, args.start)
+        else:
+            pieces = strided_mapped(args.file, args.stride, args.start)
+        target = open(args.output, "wb") if args.output else sys.stdout.buffer
+    else:
+        # newline="" keeps "\r\n" as two characters, exactly as in the file
+        source = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8",
+                                                         newline="")
+        pieces = strided(read_chunks(source), args.stride, args.start)
+        target = (open(args.output, "w", encoding="utf-8", newline="") if args.output
+                  else sys.stdout)
+    try:
+        for piece in pieces:
+            target.write(piece)
+    finally:
+        if target not in (sys.stdout, sys.stdout.buffer):
+            target.close()
+        if source not in (None, sys.stdin):
+            source.close()
+
+if __name__ == "__main__":
+    main()
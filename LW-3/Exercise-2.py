@@ -1,12 +1,109 @@
-# Input a six-digit number as a string 
-n = input("Enter a six-digit number: ")
-
-# Check if the number is six digits long 
-if len(n) == 6 and n.isdigit():
-    # Calculate the sum of the digits 
-    sum_of_digits = sum(int(digit) for digit in n)
-
-    # Output the result 
-    print(f"The sum of the digits of {n} is: {sum_of_digits}")
-else:
-    print("Invalid input. Make sure it's a six-digit natural number.")   
\ No newline at end of file
+import argparse
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for files
+    np = None
+
+# Bytes of a file processed at once
+CHUNK_SIZE = 1 << 24
+
+def digit_sum(number):
+    """Sum of the digits of a number given as a string or bytes.
+
+    Every digit is counted with one bytes.count() pass instead of converting
+    each character to int; other characters are ignored.
+    """
+    data = number.encode() if isinstance(number, str) else bytes(number)
+    return sum(digit * data.count(b"%d" % digit) for digit in range(1, 10))
+
+def file_chunks(path, chunk_size=CHUNK_SIZE):
+    """Pieces of a file as uint8 arrays: memory-mapped views, or reads for stdin."""
+    if path == "-":
+        while True:
+            chunk = sys.stdin.buffer.read(chunk_size)
+            if not chunk:
+                break
+            yield np.frombuffer(chunk, dtype=np.uint8)
+        return
+    if os.path.getsize(path) == 0:
+        return
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+def _digit_values(chunk):
+    """Value of every byte of a chunk as a digit, 0 for all other characters."""
+    values = chunk - ord("0")
+    values[values > 9] = 0
+    return values
+
+def digit_total(chunks):
+    """Sum of all digits in a stream of uint8 chunks."""
+    return sum(int(_digit_values(chunk).sum(dtype=np.int64)) for chunk in chunks)
+
+def line_digit_sums(chunks):
+    """Generator of arrays with the digit sums of the lines, chunk by chunk.
+
+    A line may span any number of chunks (a number with millions of digits):
+    the sum of its unfinished part is carried over to the next chunk. The
+    last line is produced even without a final newline.
+    """
+    carry = 0
+    pending = False
+    for chunk in chunks:
+        values = _digit_values(chunk)
+        ends = np.flatnonzero(chunk == ord("\n"))
+        if len(ends):
+            # Each line is the segment that ends with its newline (worth 0)
+            starts = np.concatenate(([0], ends[:-1] + 1))
+            sums = np.add.reduceat(values[:ends[-1] + 1], starts, dtype=np.int64)
+            sums[0] += carry
+            yield sums
+            rest = values[ends[-1] + 1:]
+            carry = int(rest.sum(dtype=np.int64))
+            pending = len(rest) > 0
+        else:
+            carry += int(values.sum(dtype=np.int64))
+            pending = True
+    if pending:
+        yield np.array([carry], dtype=np.int64)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sum of the digits of numbers")
+    parser.add_argument("file", nargs="?",
+                        help="file with one number per line (- for stdin)")
+    parser.add_argument("--total", action="store_true", help="print only the total sum")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="bytes per chunk")
+    args = parser.parse_args()
+
+    if args.file is None:
+        # Input a six-digit number as a string
+        n = input("Enter a six-digit number: ")
+
+        # Check if the number is six digits long
+        if len(n) == 6 and n.isascii() and n.isdigit():
+            # Calculate the sum of the digits
+            sum_of_digits = digit_sum(n)
+
+            # Output the result
+            print(f"The sum of the digits of {n} is: {sum_of_digits}")
+        else:
+            print("Invalid input. Make sure it's a six-digit natural number.")
+        return
+
+    chunks = file_chunks(args.file, args.chunk)
+    if args.total:
+        total = digit_total(chunks)
+    else:
+        total = 0
+        for sums in line_digit_sums(chunks):
+            total += int(sums.sum())
+            # One write per chunk of lines
+            sys.stdout.write("\n".join(map(str, sums.tolist())) + "\n")
+    print(f"Total: {total}")
+
+if __name__ == "__main__":
+    main()
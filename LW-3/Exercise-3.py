@@ -1,22 +1,91 @@
+import argparse
 import string
+import sys
+from collections import Counter
+from operator import methodcaller
 
-# Input a sentence
-sentence = input("Enter a sentence: ")
-
-# Split the sentence into words, remove punctuation and convert to lowercase
-words = sentence.split()
-cleaned_words = [word.strip(string.punctuation).lower() for word in words]
-
-# Find the duplicate word
-duplicate_word = None
-for word in cleaned_words:
-    if cleaned_words.count(word) == 2:
-        duplicate_word = word
-        break
-
-# Output the result 
-if duplicate_word:
-    print(f"Duplicate word: {duplicate_word}")
-else:
-    print("No duplicate word found.")
-     
\ No newline at end of file
+# Size of a piece of text read from a file at once
+CHUNK_SIZE = 1 << 20
+
+# Remove punctuation around a word
+strip_punctuation = methodcaller("strip", string.punctuation)
+
+def text_chunks(file, chunk_size=CHUNK_SIZE):
+    """Read a text file piece by piece."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+def count_words(chunks):
+    """Count cleaned words over a stream of text pieces in one pass.
+
+    A word cut by the end of a piece is carried over and joined with the
+    start of the next one, so pieces may be split anywhere. Raw tokens are
+    counted first and punctuation is stripped once per different token at
+    the end. The result keeps words in the order of their first appearance;
+    memory depends only on the number of different words.
+    """
+    raw = Counter()
+    tail = ""
+    for chunk in chunks:
+        chunk = tail + chunk
+        words = chunk.lower().split()
+        # The last word may continue in the next piece
+        tail = words.pop() if words and not chunk[-1].isspace() else ""
+        raw.update(words)
+    if tail:
+        raw[tail.lower()] += 1
+
+    counts = Counter()
+    for word, count in raw.items():
+        counts[strip_punctuation(word)] += count
+    # Words made only of punctuation become empty strings
+    counts.pop("", None)
+    return counts
+
+def duplicates(counts):
+    """Words that occur more than once with their counts, in order of first appearance."""
+    return {word: count for word, count in counts.items() if count > 1}
+
+def first_duplicate(counts):
+    """The first word of the text that occurs more than once, or None."""
+    return next((word for word, count in counts.items() if count > 1), None)
+
+def main():
+    parser = argparse.ArgumentParser(description="Find repeated words")
+    parser.add_argument("file", nargs="?", help="text file to scan (- for stdin)")
+    args = parser.parse_args()
+
+    if args.file is None:
+        # Input a sentence
+        sentence = input("Enter a sentence: ")
+        counts = count_words([sentence])
+        duplicate_word = first_duplicate(counts)
+
+        # Output the result
+        if duplicate_word:
+            print(f"Duplicate word: {duplicate_word}")
+        else:
+            print("No duplicate word found.")
+        return
+
+    file = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8",
+                                                     errors="replace")
+    try:
+        counts = count_words(text_chunks(file))
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+    repeated = duplicates(counts)
+    if not repeated:
+        print("No duplicate word found.")
+        return
+    print(f"Duplicate word: {first_duplicate(counts)}")
+    print(f"Words: {sum(counts.values())}, different: {len(counts)}, repeated: {len(repeated)}")
+    print("\n".join(f"{word}: {count}" for word, count in repeated.items()))
+
+if __name__ == "__main__":
+    main()
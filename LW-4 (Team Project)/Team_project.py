@@ -1,10 +1,19 @@
 # Made by Natan Nedaikhlib
 
+import io
+
+from text_stats import analyze
+
 # Initial text for processing 
 text = "Scientists have stated that new research will help understand how cosmic factors influence climate change on Earth. Similar research is important for developing strategies to counteract climate changes."
 
+# Word count, spaces, word frequencies, the beginning of the text and its
+# lowercase, title case and hyphenated versions, all in one pass
+lower, title, hyphenated = io.StringIO(), io.StringIO(), io.StringIO()
+stats = analyze([text], lower=lower, title=title, hyphenated=hyphenated)
+
 # 1. Convert the entire text to lowercase
-lower_text = text.lower()
+lower_text = lower.getvalue()
 print("Text in lowercase: ", lower_text)
 
 # 2. Split the text into words
@@ -17,29 +26,29 @@ clean_words = [word.strip(string.punctuation) for word in words]
 print("Words without punctuation:", clean_words)
 
 # 4. Count the number of words in the text
-word_count = len(clean_words)
+word_count = stats.word_count
 print("Number of words in the text: ", word_count)
 
 # 5. Convert the text to title case (title() function)Nastia-Shapoval(student2)
-text_title = text.title()  
+text_title = title.getvalue()
 print("\nText in title case:\n", text_title)
 
 # 6. Count the number of occurrences of the word 'is'Nastia-Shapoval(student2)
-count_is = lower_text.count(' is ')  
+count_is = stats.frequencies['is']
 print("Number of occurrences of the word 'is':", count_is)
 
 # 7. Check if the string starts with 'Scientists'Nastia-Shapoval(student2)
-starts_with_scientists = text.startswith('Scientists')
+starts_with_scientists = stats.starts_with('Scientists')
 print("Does the text start with 'Scientists'? ", starts_with_scientists)
 
 # 8. Counting the number of characters that are spaces Yana Ponomarova (student3)
-space_count = text.count(" ")
+space_count = stats.space_count
 print("Number of spaces:", space_count)
 
 # 9. Converting the first letter of each word to uppercase Yana Ponomarova (student3)
-title_text = text.title()
+title_text = text_title
 print("Text with each word capitalized:", title_text)
 
 # 10. Replacing all spaces with hyphens Yana Ponomarova (student3)
-hyphenated_text = text.replace(" ", "-")
+hyphenated_text = hyphenated.getvalue()
 print("Text with hyphens instead of spaces:", hyphenated_text)
@@ -0,0 +1,127 @@
+import argparse
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+from text_stats import read_chunks, word_aligned
+
+# A word: letters and digits, possibly joined by apostrophes ("don't")
+TOKEN = re.compile(r"\w+(?:['’]\w+)*")
+
+
+def tokenize(text):
+    """Normalized tokens of a text: lowercase words without punctuation."""
+    return TOKEN.findall(text.lower())
+
+
+class TermIndex:
+    """Term-frequency index of a text built once and queried many times.
+
+    counts maps every token to the number of its occurrences, so a word
+    count is a single dictionary lookup. With positions=True postings also
+    keep the word positions of every token as a compact array('I') (4 bytes
+    per occurrence, sorted), which answers phrase and position queries.
+    """
+
+    def __init__(self, positions=True):
+        self.counts = Counter()
+        self.postings = {} if positions else None
+        self.length = 0  # number of tokens indexed so far
+
+    @classmethod
+    def from_text(cls, text, positions=True):
+        index = cls(positions)
+        index.add(text)
+        return index
+
+    @classmethod
+    def from_chunks(cls, chunks, positions=True):
+        """Index a text given as pieces (for example read_chunks() of a file)."""
+        index = cls(positions)
+        for chunk in word_aligned(chunks):
+            index.add(chunk)
+        return index
+
+    def add(self, text):
+        """Append text to the indexed document; it must not start inside a word."""
+        tokens = tokenize(text)
+        self.counts.update(tokens)
+        if self.postings is not None:
+            postings = self.postings
+            for position, token in enumerate(tokens, self.length):
+                occurrences = postings.get(token)
+                if occurrences is None:
+                    occurrences = postings[token] = array("I")
+                occurrences.append(position)
+        self.length += len(tokens)
+
+    def count(self, query):
+        """Occurrences of a word, or of a phrase if the query has several words."""
+        tokens = tokenize(query)
+        if len(tokens) == 1:
+            return self.counts.get(tokens[0], 0)
+        return len(self.phrase_positions(tokens))
+
+    def positions(self, word):
+        """Word positions at which the word occurs (empty if it does not)."""
+        tokens = tokenize(word)
+        if len(tokens) != 1:
+            raise ValueError(f"expected a single word, got {word!r}")
+        self._require_positions()
+        return self.postings.get(tokens[0], array("I"))
+
+    def phrase_positions(self, phrase):
+        """Start positions of a phrase (a string or a list of tokens).
+
+        Candidates come from the rarest word of the phrase; every other word
+        is checked by binary search in its sorted postings, so the cost
+        depends on the postings, not on the length of the text.
+        """
+        self._require_positions()
+        tokens = tokenize(phrase) if isinstance(phrase, str) else phrase
+        if not tokens:
+            return []
+        postings = [self.postings.get(token) for token in tokens]
+        if any(occurrences is None for occurrences in postings):
+            return []
+        rarest = min(range(len(tokens)), key=lambda i: len(postings[i]))
+        found = []
+        for position in postings[rarest]:
+            start = position - rarest
+            if start < 0:
+                continue
+            for offset, occurrences in enumerate(postings):
+                target = start + offset
+                i = bisect_left(occurrences, target)
+                if i == len(occurrences) or occurrences[i] != target:
+                    break
+            else:
+                found.append(start)
+        return found
+
+    def contains(self, phrase):
+        return bool(self.phrase_positions(phrase))
+
+    def _require_positions(self):
+        if self.postings is None:
+            raise ValueError("the index was built without positions")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Word and phrase queries over a text")
+    parser.add_argument("file", help="text file (- for stdin)")
+    parser.add_argument("queries", nargs="+", help="words or phrases to count")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8",
+                                                     errors="replace")
+    try:
+        index = TermIndex.from_chunks(read_chunks(source))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(f"Words: {index.length}, different: {len(index.counts)}")
+    for query in args.queries:
+        print(f"{query!r}: {index.count(query)}")
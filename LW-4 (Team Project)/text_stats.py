@@ -0,0 +1,160 @@
+import argparse
+import string
+import sys
+from collections import Counter
+from operator import methodcaller
+
+# Characters of a file processed at once
+CHUNK_SIZE = 1 << 20
+
+# How many first characters are kept for starts_with()
+HEAD_SIZE = 1024
+
+strip_punctuation = methodcaller("strip", string.punctuation)
+
+
+def read_chunks(file, chunk_size=CHUNK_SIZE):
+    """Read a text file piece by piece."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def word_aligned(chunks):
+    """Re-cut text pieces so that none of them ends in the middle of a word.
+
+    Everything after the last whitespace of a piece is moved to the next
+    one, so word-level methods such as lower() and title() give the same
+    result piece by piece as on the whole text.
+    """
+    tail = ""
+    for chunk in chunks:
+        chunk = tail + chunk
+        if not chunk:
+            continue
+        if chunk[-1].isspace():
+            cut = len(chunk)
+        else:
+            cut = len(chunk) - len(chunk.rsplit(None, 1)[-1])
+        if cut == 0:
+            tail = chunk  # A single word longer than the piece
+            continue
+        tail = chunk[cut:]
+        yield chunk[:cut]
+    if tail:
+        yield tail
+
+
+def lower_chunks(chunks):
+    """The text in lowercase, piece by piece."""
+    return map(str.lower, word_aligned(chunks))
+
+
+def title_chunks(chunks):
+    """The text in title case, piece by piece."""
+    return map(str.title, word_aligned(chunks))
+
+
+def hyphenated_chunks(chunks):
+    """The text with hyphens instead of spaces, piece by piece."""
+    return (chunk.replace(" ", "-") for chunk in chunks)
+
+
+class TextStats:
+    """Statistics of a text gathered in one pass over its pieces.
+
+    word_count and space_count match len(text.split()) and text.count(" "),
+    frequencies counts lowercase words without surrounding punctuation in
+    the order of their first appearance. Memory depends on the number of
+    different words, not on the length of the text.
+    """
+
+    def __init__(self, head_size=HEAD_SIZE):
+        self.word_count = 0
+        self.space_count = 0
+        self.char_count = 0
+        self.head = ""
+        self.head_size = head_size
+        self.raw = Counter()
+        self._frequencies = None
+
+    def feed(self, chunk):
+        """Add a word-aligned piece of text (see word_aligned())."""
+        if len(self.head) < self.head_size:
+            self.head += chunk[:self.head_size - len(self.head)]
+        self.char_count += len(chunk)
+        self.space_count += chunk.count(" ")
+        words = chunk.lower().split()
+        self.word_count += len(words)
+        # Raw tokens are counted now, punctuation is stripped once per token later
+        self.raw.update(words)
+        self._frequencies = None
+
+    @property
+    def frequencies(self):
+        if self._frequencies is None:
+            counts = Counter()
+            for word, count in self.raw.items():
+                counts[strip_punctuation(word)] += count
+            # Words made only of punctuation become empty strings
+            counts.pop("", None)
+            self._frequencies = counts
+        return self._frequencies
+
+    def starts_with(self, prefix):
+        if len(prefix) > self.head_size:
+            raise ValueError(f"only the first {self.head_size} characters are kept")
+        return self.head.startswith(prefix)
+
+    def summary(self):
+        lines = [f"Characters: {self.char_count}",
+                 f"Words: {self.word_count}, different: {len(self.frequencies)}",
+                 f"Spaces: {self.space_count}",
+                 "Most common: " + ", ".join(f"{word} ({count})"
+                                             for word, count in self.frequencies.most_common(10))]
+        return "\n".join(lines)
+
+
+def analyze(chunks, lower=None, title=None, hyphenated=None, head_size=HEAD_SIZE):
+    """Gather TextStats over text pieces in one pass.
+
+    lower, title and hyphenated may be writable text streams: the transformed
+    text is written into them during the same pass, so the input is read once.
+    """
+    stats = TextStats(head_size)
+    for chunk in word_aligned(chunks):
+        stats.feed(chunk)
+        if lower is not None:
+            lower.write(chunk.lower())
+        if title is not None:
+            title.write(chunk.title())
+        if hyphenated is not None:
+            hyphenated.write(chunk.replace(" ", "-"))
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Text statistics in one pass")
+    parser.add_argument("file", help="text file (- for stdin)")
+    parser.add_argument("--lower", help="write the lowercase text to this file")
+    parser.add_argument("--title", help="write the title case text to this file")
+    parser.add_argument("--hyphenated", help="write the text with hyphens to this file")
+    parser.add_argument("--prefix", help="check whether the text starts with this")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8",
+                                                     errors="replace")
+    outputs = {name: open(getattr(args, name), "w", encoding="utf-8")
+               for name in ("lower", "title", "hyphenated") if getattr(args, name)}
+    try:
+        stats = analyze(read_chunks(source), **outputs)
+    finally:
+        for output in outputs.values():
+            output.close()
+        if source is not sys.stdin:
+            source.close()
+    print(stats.summary())
+    if args.prefix is not None:
+        print(f"Starts with {args.prefix!r}: {stats.starts_with(args.prefix)}")
@@ -1,7 +1,73 @@
-N = int(input("Enter the number of array elements N: "))
-numbers = [float(input(f"Element {i+1}: ")) for i in range(N)]
+import argparse
+import os
+import sys
 
-print("Non-zero elements in reverse order:")
-for num in reversed(numbers):
-    if num != 0:
-        print(num)
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for files
+    np = None
+
+# Elements processed at once when scanning from the end
+CHUNK_SIZE = 1 << 22
+
+def load_numbers(path, binary=False):
+    """Numbers of a file as one float64 array (8 bytes per element).
+
+    A binary file holds raw little-endian float64 values and is memory-mapped,
+    so it is not even read into memory; a text file holds one number per line.
+    """
+    if binary:
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype="<f8")  # An empty file cannot be memory-mapped
+        return np.memmap(path, dtype="<f8", mode="r")
+    return np.loadtxt(path, dtype=np.float64, ndmin=1)
+
+def reversed_nonzero(numbers, chunk_size=CHUNK_SIZE):
+    """Generator of the non-zero elements in reverse order, chunk by chunk.
+
+    The array is walked from its end; every chunk is filtered with a
+    vectorized mask, so only the non-zero part of one chunk is copied.
+    """
+    for end in range(len(numbers), 0, -chunk_size):
+        block = numbers[max(0, end - chunk_size):end]
+        yield block[block != 0][::-1]
+
+def main():
+    parser = argparse.ArgumentParser(description="Non-zero elements in reverse order")
+    parser.add_argument("file", nargs="?", help="file with the numbers")
+    parser.add_argument("--binary", action="store_true",
+                        help="the file holds raw little-endian float64 values")
+    parser.add_argument("--binary-output", action="store_true",
+                        help="write raw float64 values instead of text")
+    parser.add_argument("--output", help="write the result here instead of stdout")
+    args = parser.parse_args()
+
+    if args.file is None:
+        N = int(input("Enter the number of array elements N: "))
+        numbers = [float(input(f"Element {i+1}: ")) for i in range(N)]
+
+        print("Non-zero elements in reverse order:")
+        for num in reversed(numbers):
+            if num != 0:
+                print(num)
+        return
+
+    numbers = load_numbers(args.file, args.binary)
+    mode = "wb" if args.binary_output else "w"
+    if args.output:
+        target = open(args.output, mode)
+    else:
+        target = sys.stdout.buffer if args.binary_output else sys.stdout
+    try:
+        for chunk in reversed_nonzero(numbers):
+            # One write per chunk; text uses the same form as print(num)
+            if args.binary_output:
+                target.write(chunk.astype("<f8").tobytes())
+            elif len(chunk):
+                target.write("\n".join(map(repr, chunk.tolist())) + "\n")
+    finally:
+        if args.output:
+            target.close()
+
+if __name__ == "__main__":
+    main()
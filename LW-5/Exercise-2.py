@@ -1,9 +1,104 @@
-size = 7
+import argparse
+import sys
 
-array = [
-    [1 if i == 0 or i == size - 1 or j == 0 or j == size - 1 else 0 for j in range(size)]
-    for i in range(size)
-]
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the array modes
+    np = None
 
-for row in array:
-    print(' '.join(map(str, row)))
+# Bytes of text written at once when printing
+WRITE_SIZE = 1 << 20
+
+class BorderMatrix:
+    """A size x size matrix of ones on the border and zeros inside, computed lazily.
+
+    Nothing is stored: m[i, j] gives a cell, m[i] a row as a list, and
+    iterating yields the rows one by one.
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def _position(self, index):
+        """A row or column index as in a list: negative counts from the end."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("BorderMatrix index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            i, j = map(self._position, index)
+            return 1 if i == 0 or i == self.size - 1 or j == 0 or j == self.size - 1 else 0
+        i = self._position(index)
+        return [self[i, j] for j in range(self.size)]
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self[i]
+
+def border_array(size, packed=False, path=None):
+    """The matrix as a uint8 NumPy array, or with packed=True as np.packbits rows.
+
+    With path the array is a .npy file opened as a memory map: only the
+    border is written, so even huge sizes need no memory.
+    """
+    shape = (size, (size + 7) // 8 if packed else size)
+    if path is None:
+        array = np.zeros(shape, dtype=np.uint8)
+    else:
+        array = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=shape)
+    if size == 0:
+        return array
+    if packed:
+        full = np.packbits(np.ones(size, dtype=np.uint8))
+        array[0] = array[-1] = full
+        # Inner rows: the first and the last bit of the row
+        array[1:-1, 0] |= 0x80
+        array[1:-1, (size - 1) // 8] |= 0x80 >> ((size - 1) % 8)
+    else:
+        array[0] = array[-1] = 1
+        array[:, 0] = array[:, -1] = 1
+    return array
+
+def write_border_text(size, target):
+    """Print the matrix as text; only two rows are ever formatted.
+
+    Every row is either all ones or the inner pattern, so the inner row is
+    formatted once and written repeatedly in blocks of about WRITE_SIZE.
+    """
+    if size == 0:
+        return
+    full = " ".join(["1"] * size) + "\n"
+    target.write(full)
+    if size == 1:
+        return
+    if size > 2:
+        inner = " ".join(["1"] + ["0"] * (size - 2) + ["1"]) + "\n"
+        per_write = max(1, WRITE_SIZE // len(inner))
+        block = inner * per_write
+        rows = size - 2
+        for _ in range(rows // per_write):
+            target.write(block)
+        target.write(inner * (rows % per_write))
+    target.write(full)
+
+def main():
+    parser = argparse.ArgumentParser(description="Matrix with ones on the border")
+    parser.add_argument("size", nargs="?", type=int, default=7)
+    parser.add_argument("--npy", metavar="FILE",
+                        help="save as a memory-mapped .npy uint8 array instead of printing")
+    parser.add_argument("--packed", action="store_true", help="pack 8 cells per byte in --npy")
+    args = parser.parse_args()
+
+    if args.npy:
+        border_array(args.size, args.packed, args.npy).flush()
+    else:
+        write_border_text(args.size, sys.stdout)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
+from removal_module import remove_values
+
 def remove_element(lst, value):
-    return [item for item in lst if item != value]
+    return remove_values(list(lst), {value})
 
 # Input the list from the user
 user_input = input("Enter the list elements separated by spaces: ")
@@ -0,0 +1,54 @@
+import sys
+import time
+from array import array
+
+import numpy as np
+
+from removal_module import remove_values, without_values, without_values_chunks
+
+
+def comprehension_remove(lst, values):
+    """The original comprehension, kept as the reference for the benchmark."""
+    return [item for item in lst if item not in values]
+
+
+def measure(function, *args):
+    """Return the time in seconds of one call of function(*args) and its result."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng(1)
+    data = rng.integers(0, 1000, n)
+    values = set(range(0, 1000, 7))  # about 14% of the elements are removed
+
+    base_time, expected = measure(comprehension_remove, data.tolist(), values)
+    print(f"{n} elements, {len(values)} values to remove, {n - len(expected)} removed")
+    print(f"{'method': <22} {'time, s': >10} {'speedup': >10}")
+    print(f"{'comprehension': <22} {base_time: >10.4f} {'1.0x': >10}")
+
+    chunked = lambda items, values: np.concatenate(list(without_values_chunks(
+        (items[i:i + 1_000_000] for i in range(0, n, 1_000_000)), values)))
+    # (name, function, input builder): inputs are built before the timing starts
+    candidates = [
+        ("list write cursor", remove_values, data.tolist),
+        ("array('q') in place", remove_values, lambda: array("q", data.tobytes())),
+        ("NumPy in place", remove_values, data.copy),
+        ("streaming filter", lambda items, values: list(without_values(items, values)),
+         data.tolist),
+        ("streaming chunks", chunked, lambda: data),
+    ]
+    for name, function, make_input in candidates:
+        elapsed, result = measure(function, make_input(), values)
+        result = result.tolist() if hasattr(result, "tolist") else list(result)
+        if result != expected:
+            print(f"{name}: result differs!")
+            return
+        print(f"{name: <22} {elapsed: >10.4f} {base_time / elapsed: >9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from array import array
+from itertools import filterfalse
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy lists and arrays are compacted in Python
+    np = None
+
+# Elements of a list filtered at once by the write cursor
+LIST_BLOCK = 4096
+
+
+def _as_set(values):
+    return values if isinstance(values, (set, frozenset)) else set(values)
+
+
+def _numeric(values, dtype):
+    """The values that can equal an element of a buffer of dtype, as an array of that dtype.
+
+    Every value is converted to dtype and kept only if it converts exactly,
+    so comparing in dtype finds the same elements as Python's == would
+    (2**53 + 1 never matches a float64 2**53, Fraction(1, 2) matches 0.5).
+    """
+    scalar = np.dtype(dtype).type
+    numbers = []
+    for value in values:
+        if isinstance(value, complex) and not value.imag and dtype.kind != "c":
+            value = value.real
+        try:
+            number = scalar(value)
+        except (TypeError, ValueError, OverflowError):
+            continue
+        if number.item() == value:
+            numbers.append(number)
+    return np.array(numbers, dtype=dtype)
+
+
+def _numpy_compact(buffer, values):
+    """Move the elements of a 1-D NumPy array that are not in values to its front.
+
+    Returns the number of kept elements. The boolean mask and the kept
+    elements are the only temporaries; the array itself is not reallocated.
+    """
+    numbers = _numeric(values, buffer.dtype)
+    if not numbers.size:
+        return len(buffer)
+    keep = ~np.isin(buffer, numbers)
+    count = int(np.count_nonzero(keep))
+    buffer[:count] = buffer[keep]
+    return count
+
+
+def _list_compact(items, values, block=LIST_BLOCK):
+    """Single-pass write-cursor compaction of a list (or array.array); returns the kept count.
+
+    The list is read block by block and the kept elements of each block are
+    written back at the cursor, which never overtakes the reading position,
+    so only one block is ever copied.
+    """
+    write = 0
+    contains = values.__contains__
+    rebuild = (lambda kept: array(items.typecode, kept)) if isinstance(items, array) else list
+    for start in range(0, len(items), block):
+        kept = rebuild(filterfalse(contains, items[start:start + block]))
+        items[write:write + len(kept)] = kept
+        write += len(kept)
+    return write
+
+
+def remove_values(sequence, values):
+    """Remove every element that is in values, in place.
+
+    A list is compacted with a write cursor and shortened. An array.array is
+    compacted through a NumPy view of its buffer with a boolean mask (or with
+    the write cursor without NumPy) and shortened. A 1-D NumPy array cannot
+    change its size, so its kept elements are moved to the front and that
+    view is returned; lists and arrays are returned themselves.
+    """
+    values = _as_set(values)
+    if np is not None and isinstance(sequence, np.ndarray):
+        if sequence.ndim != 1:
+            raise ValueError("only 1-D NumPy arrays can be compacted in place")
+        return sequence[:_numpy_compact(sequence, values)]
+    if np is not None and isinstance(sequence, array) and sequence.typecode != "u":
+        view = np.frombuffer(sequence, dtype=sequence.typecode)
+        count = _numpy_compact(view, values)
+        del view  # The array cannot be resized while the view exists
+    else:
+        count = _list_compact(sequence, values)
+    del sequence[count:]
+    return sequence
+
+
+def without_values(iterable, values):
+    """Stream the elements of an iterable that are not in values."""
+    return filterfalse(_as_set(values).__contains__, iterable)
+
+
+def without_values_chunks(chunks, values):
+    """Stream NumPy chunks with the elements from values removed from each one."""
+    values = _as_set(values)
+    numbers = {}  # dtype -> the values converted to it
+    for chunk in chunks:
+        if chunk.dtype not in numbers:
+            numbers[chunk.dtype] = _numeric(values, chunk.dtype)
+        found = numbers[chunk.dtype]
+        yield chunk[~np.isin(chunk, found)] if found.size else chunk